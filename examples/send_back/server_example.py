@@ -8,8 +8,11 @@ Includes examples of how to add the built-in endpoints and how to make
 your own endpoints.
 """
 
+import json
+
 from com_server import Connection, ConnectionResource, RestApiHandler
 from com_server.api import Builtins
+from flask import Response
 
 # make the Connection object
 conn = Connection(baud=115200, port="/dev/ttyUSB0") # if Linux
@@ -71,6 +74,24 @@ class Hello_World_Endpoint(ConnectionResource):
             "Received": self.conn.receive_str()
         }    
 
+# the same endpoint, but building the JSON response directly:
+@handler.add_endpoint("/hello_world_fast")
+class Hello_World_Fast_Endpoint(ConnectionResource):
+    # the part of the response that never changes is encoded once, when the class is made
+    _PREFIX = b'{"Hello": "World!", "Received": '
+    _SUFFIX = b'}'
+
+    def get(self):
+        """
+        Responds with the same thing as "/hello_world", but only encodes the received data
+        on each request instead of building a dict and letting flask_restful encode all of it.
+        """
+
+        body = self._PREFIX + json.dumps(self.conn.receive_str()).encode("utf-8") + self._SUFFIX
+
+        # returning a Response object skips flask_restful's JSON encoding
+        return Response(body, mimetype="application/json")
+
 # start the Flask development server on http://0.0.0.0:8080 (not recommended because slow)
 # handler.run_dev(host="0.0.0.0", port=8080)
 
@@ -1,30 +1,64 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import importlib
 import os
 import sys
+import typing as t
 
 # detect platform
-if os.name != "posix" and os.name != "nt":
+if os.name not in ("posix", "nt"):
     raise EnvironmentError("Platform not supported")
 
 # detect version of python
-vers = sys.version_info
-if vers.major < 3 or (vers.major == 3 and vers.minor < 6):
+if sys.version_info < (3, 6):
     raise EnvironmentError("Python version >= 3.6 is required")
 
-from .api_server import ConnectionResource, EndpointExistsException, RestApiHandler
 from .base_connection import ConnectException
 from .connection import Connection
 from .constants import *
-from .server import (
-    ConnectionRoutes,
-    add_resources,
-    disconnect_conns,
-    start_app,
-    start_conns,
-    DuplicatePortException,
-)
 from .tools import ReceiveQueue, SendQueue, all_ports
 
+# names from the server modules, which import Flask, flask_restful, flask_cors,
+# and waitress; these are only imported when one of the names is first used
+# so that programs that only use `Connection` do not have to load them
+_LAZY_IMPORTS = {
+    "ConnectionResource": "api_server",
+    "EndpointExistsException": "api_server",
+    "RestApiHandler": "api_server",
+    "ConnectionRoutes": "server",
+    "add_resources": "server",
+    "disconnect_conns": "server",
+    "start_app": "server",
+    "start_conns": "server",
+    "DuplicatePortException": "server",
+}
+
+if t.TYPE_CHECKING or sys.version_info < (3, 7):
+    # module level __getattr__ is not supported before Python 3.7
+    from .api_server import ConnectionResource, EndpointExistsException, RestApiHandler
+    from .server import (
+        ConnectionRoutes,
+        add_resources,
+        disconnect_conns,
+        start_app,
+        start_conns,
+        DuplicatePortException,
+    )
+else:
+
+    def __getattr__(name: str) -> t.Any:
+        if name not in _LAZY_IMPORTS:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # only look it up once
+
+        return value
+
+    def __dir__() -> t.List[str]:
+        return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __version__ = "0.2b1"
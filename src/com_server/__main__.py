@@ -11,16 +11,8 @@ import logging
 import sys
 
 import click
-from flask import Flask
-from flask import __version__ as f_v
-from flask_cors import CORS
-from flask_restful import Api
-from serial import __version__ as s_v
 
 from . import __version__
-from .api import V1
-from .connection import Connection
-from .server import ConnectionRoutes, start_app
 
 # logger setup
 logger = logging.getLogger(__name__)
@@ -38,6 +30,10 @@ logger.addHandler(handler)
 
 
 def _display_version() -> None:
+    # imported here so that the CLI does not import them when not needed
+    from flask import __version__ as f_v
+    from serial import __version__ as s_v
+
     _pyth_v = sys.version_info
 
     p_o = (
@@ -110,6 +106,11 @@ def main(ctx: click.Context, version: bool) -> None:
     is_flag=True,
     help="If set, then the program will add cross origin resource sharing to all routes.",
 )
+@click.option(
+    "--low-latency",
+    is_flag=True,
+    help="If set, then the program will put the serial port in low latency mode (Linux only).",
+)
 def run(
     baud: int,
     serport: str,
@@ -120,6 +121,7 @@ def run(
     queue_size: int,
     logfile: str,
     cors: bool,
+    low_latency: bool,
 ) -> None:
     """
     Launches waitress server with builtin API
@@ -140,6 +142,16 @@ def run(
     will be an error.
     """
 
+    # imported here so that other commands and options (e.g. --version)
+    # do not have to import the server
+    from flask import Flask
+    from flask_cors import CORS
+    from flask_restful import Api
+
+    from .api import V1
+    from .connection import Connection
+    from .server import ConnectionRoutes, start_app
+
     # start connection and server
 
     logger.info("Starting up connection with serial port...")
@@ -150,10 +162,12 @@ def run(
         timeout=timeout,
         send_interval=send_int,
         queue_size=queue_size,
+        low_latency=low_latency,
     ) as conn:
         logger.info(f"Connection with serial port established at {conn.port}")
 
         app = Flask(__name__)
+        app.config["RESTFUL_JSON"] = {"separators": (",", ":")}  # compact JSON responses
         api = Api(app, catch_all_404s=True)
 
         if cors:
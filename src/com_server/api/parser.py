@@ -0,0 +1,192 @@
+# /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Parser for the arguments of requests made to the builtin endpoints.
+"""
+
+import typing as t
+
+import flask_restful
+from flask import request
+from werkzeug.exceptions import BadRequest
+
+MISSING_MESSAGE = (
+    "Missing required parameter in the JSON body or the post body or the query string"
+)
+
+
+_TRUE = frozenset(("1", "true", "yes", "on"))
+_FALSE = frozenset(("0", "false", "no", "off", ""))
+
+
+def boolean(value: t.Any) -> bool:
+    """Converts the value of an argument to a bool.
+
+    Unlike `bool()`, the strings "false", "0", "no", and "off" (in any case) are False.
+
+    Args:
+        value (Any): The value from the request.
+
+    Raises:
+        ValueError: If `value` is a string that is not a boolean.
+
+    Returns:
+        bool: The boolean value.
+    """
+
+    if not isinstance(value, str):
+        return bool(value)  # JSON true, false, and numbers
+
+    lowered = value.lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+
+    raise ValueError(f"Invalid literal for boolean(): {value}")
+
+
+class _Argument(t.NamedTuple):
+    """An argument added to `RequestParser`"""
+
+    name: str
+    default: t.Any
+    required: bool
+    type: t.Callable[[t.Any], t.Any]
+    action: str
+    help: t.Optional[str]
+
+
+class RequestParser:
+    """Parses arguments from the JSON body, form, and query string of a request.
+
+    Works like `flask_restful.reqparse.RequestParser` for the options that the
+    builtin endpoints use, but collects the values from the request once per request
+    rather than once for every argument, and does not go through reqparse's
+    per-argument location, operator, and type handling.
+    """
+
+    def __init__(self) -> None:
+        """Constructor for request parser"""
+
+        self._args: t.List[_Argument] = []
+        self._names: t.FrozenSet[str] = frozenset()
+        self._defaults: t.Dict[str, t.Any] = {}
+        self._required = False  # if any argument is required
+
+    def add_argument(
+        self,
+        name: str,
+        default: t.Any = None,
+        required: bool = False,
+        type: t.Callable[[t.Any], t.Any] = str,
+        action: str = "store",
+        help: t.Optional[str] = None,
+    ) -> "RequestParser":
+        """Adds an argument to be parsed.
+
+        Args:
+            name (str): The name of the argument.
+            default (Any, optional): The value of the argument if it is not in the request. Defaults to None.
+            required (bool, optional): If True, responds with `400 Bad Request` if the argument is not in the request. Defaults to False.
+            type (Callable[[Any], Any], optional): Converts each value of the argument. Defaults to str.
+            action (str, optional): "store" to keep the first value, "append" to keep a list of all values. Defaults to "store".
+            help (str, None, optional): The error message if the argument is missing or cannot be converted. Defaults to None.
+
+        Returns:
+            RequestParser: This object, so that calls can be chained.
+        """
+
+        self._args.append(_Argument(name, default, required, type, action, help))
+        self._names = frozenset(arg.name for arg in self._args)
+        self._defaults[name] = default
+        self._required = self._required or required
+
+        return self
+
+    def parse_args(self, strict: bool = False) -> t.Dict[str, t.Any]:
+        """Parses the arguments of the current request.
+
+        Args:
+            strict (bool, optional): If True, responds with `400 Bad Request` if the request \
+            has arguments that were not added to the parser. Defaults to False.
+
+        Returns:
+            Dict[str, Any]: The value of each argument mapped to its name.
+        """
+
+        if not self._required and _request_empty():
+            # nothing to parse, so every argument is its default
+            return dict(self._defaults)
+
+        source = _request_source()
+
+        args: t.Dict[str, t.Any] = {}
+        for arg in self._args:
+            values = source.get(arg.name)
+
+            if not values:
+                if arg.required:
+                    _abort(arg, MISSING_MESSAGE)
+
+                args[arg.name] = arg.default
+                continue
+
+            try:
+                converted = [None if v is None else arg.type(v) for v in values]
+            except Exception as e:
+                _abort(arg, str(e))
+
+            args[arg.name] = converted if arg.action == "append" else converted[0]
+
+        if strict:
+            unknown = [name for name in source if name not in self._names]
+            if unknown:
+                raise BadRequest(f"Unknown arguments: {', '.join(unknown)}")
+
+        return args
+
+
+def _request_empty() -> bool:
+    """
+    Checks if the current request has no query string and no body
+    """
+
+    return (
+        not request.args
+        and not request.content_length
+        and "Transfer-Encoding" not in request.headers  # chunked bodies have no length
+    )
+
+
+def _request_source() -> t.Dict[str, t.List[t.Any]]:
+    """
+    Combines the JSON body, form, and query string of the current request
+    into the values of each argument
+    """
+
+    source: t.Dict[str, t.List[t.Any]] = {}
+
+    body = request.get_json(silent=True)
+    if isinstance(body, dict):
+        # lists in the JSON body become multiple values
+        source = {k: v if isinstance(v, list) else [v] for k, v in body.items()}
+
+    # a JSON request has no form, so only look at its query string
+    values = request.args if request.is_json else request.values
+
+    for name, vals in values.lists():
+        source[name] = source.get(name, []) + vals
+
+    return source
+
+
+def _abort(arg: _Argument, error: str) -> t.NoReturn:
+    """
+    Responds with `400 Bad Request` for an argument, like reqparse does
+    """
+
+    flask_restful.abort(400, message={arg.name: arg.help or error})
+    # flask_restful.abort() is untyped, so type checkers do not know that it raises
+    raise AssertionError("flask_restful.abort() did not raise")
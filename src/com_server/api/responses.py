@@ -0,0 +1,64 @@
+# /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Responses shared by the builtin endpoints.
+"""
+
+import typing as t
+
+import flask
+from flask_restful.representations.json import output_json
+
+# bodies that never change, encoded once the way `RestApiHandler` encodes them
+_OK_BODY = b'{"message":"OK"}\n'
+_NOTHING_RECEIVED_BODY = b'{"message":"OK","timestamp":null,"data":null}\n'
+
+
+def ok() -> flask.Response:
+    """Makes a `200 OK` response with the body `{"message": "OK"}`.
+
+    A new response is made each time because Flask and `after_request`
+    functions can change the response that is returned.
+
+    Returns:
+        flask.Response: The response.
+    """
+
+    return flask.Response(_OK_BODY, mimetype="application/json")
+
+
+def nothing_received() -> flask.Response:
+    """Makes a `200 OK` response for `/receive` when nothing has been received.
+
+    The body is `{"message": "OK", "timestamp": null, "data": null}`.
+
+    Returns:
+        flask.Response: The response.
+    """
+
+    return flask.Response(_NOTHING_RECEIVED_BODY, mimetype="application/json")
+
+
+def conditional(data: dict, max_age: int) -> flask.Response:
+    """Makes a JSON response that clients can cache and revalidate.
+
+    The ETag is a hash of the body, so it changes whenever the data does.
+    Responds with `304 Not Modified` if the request's `If-None-Match`
+    header matches the ETag.
+
+    Args:
+        data (dict): The data to respond with.
+        max_age (int): How many seconds clients can use the response for before asking again.
+
+    Returns:
+        flask.Response: The response, which is `304 Not Modified` if the client already has it.
+    """
+
+    response = output_json(data, 200)
+    response.mimetype = "application/json"  # `Api` sets this for responses it makes
+    response.add_etag()
+    response.cache_control.max_age = max_age
+
+    # `output_json` is untyped, and `make_conditional` returns the same object
+    return t.cast(flask.Response, response.make_conditional(flask.request))
@@ -5,12 +5,429 @@
 Version 0 of Builtin API. All endpoints below will be prefixed with /v0/ and cannot be used.
 """
 
+import logging
+import sys
 import typing as t
 
+import flask
 import flask_restful
-from flask_restful import reqparse
 
-from .. import Connection, ConnectionResource, RestApiHandler, all_ports
+from .. import Connection, ConnectionResource, RestApiHandler
+from ..constants import DEFAULT_CONCATENATE, DEFAULT_ENDING
+from ..tools import cached_ports
+from .parser import RequestParser, boolean
+from .responses import conditional, nothing_received, ok
+
+# logs the arguments each endpoint receives if `verbose` is True
+_logger = logging.getLogger(__name__)
+
+
+def _init_verbose_logger() -> None:
+    """Makes the logger print to stdout like `print()` did"""
+
+    _logger.setLevel(logging.DEBUG)
+    _logger.propagate = False  # prevents from logging twice if root logger is configured
+
+    if not _logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setLevel(logging.DEBUG)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        _logger.addHandler(handler)
+
+
+class _BuiltinResource(ConnectionResource):
+    """Base class of the builtin resources"""
+
+    # set on the subclass that each `Builtins` object registers;
+    # prints the arguments each endpoint receives to stdout if True
+    verbose = False
+
+
+class _Sending(_BuiltinResource):
+    """/send"""
+
+    # make parser once when class is declared, don't add arguments each time request is made aka don't put in post()
+    parser = RequestParser()
+    parser.add_argument(
+        "data",
+        required=True,
+        action="append",
+        help="Data the serial port should send; is required",
+    )
+    parser.add_argument(
+        "ending",
+        default=DEFAULT_ENDING,
+        help="Ending that will be appended to the end of data before sending over serial port; default carriage return + newline",
+    )
+    parser.add_argument(
+        "concatenate",
+        default=DEFAULT_CONCATENATE,
+        help="What the strings in data should be concatenated by if list; by default a space",
+    )
+
+    def post(self) -> flask.Response:
+        args = self.parser.parse_args(strict=True)
+
+        if self.verbose:
+            _logger.debug("Arguments for /send: %s", args)
+
+        # no need for check_type because everything will be parsed as a string
+        res = self.conn.send(
+            *args["data"],
+            ending=args["ending"],
+            concatenate=args["concatenate"],
+        )
+
+        if not res:
+            # abort if failed to send
+            flask_restful.abort(502, message="Failed to send")
+
+        return ok()
+
+
+class _Receiving(_BuiltinResource):
+    """/receive"""
+
+    parser = RequestParser()
+    parser.add_argument(
+        "num_before", type=int, default=0, help="Which receive data to return"
+    )
+    parser.add_argument(
+        "read_until",
+        default=None,
+        help="What character the string should read until",
+    )
+    parser.add_argument(
+        "strip",
+        type=boolean,
+        default=False,
+        help="If the string should be stripped of whitespaces and newlines before responding",
+    )
+
+    def get(self) -> t.Union[dict, flask.Response]:
+        res = self.conn.receive_str()
+
+        if res is None:
+            return nothing_received()
+
+        timestamp, data = res
+
+        return {"message": "OK", "timestamp": timestamp, "data": data}
+
+    def post(self) -> t.Union[dict, flask.Response]:
+        args = self.parser.parse_args(strict=True)
+
+        if self.verbose:
+            _logger.debug("Arguments for /receive: %s", args)
+
+        res = self.conn.receive_str(
+            num_before=args["num_before"],
+            read_until=args["read_until"],
+            strip=args["strip"],
+        )
+
+        if res is None:
+            return nothing_received()
+
+        timestamp, data = res
+
+        return {"message": "OK", "timestamp": timestamp, "data": data}
+
+
+class _ReceiveAll(_BuiltinResource):
+    """/receive/all"""
+
+    parser = RequestParser()
+    parser.add_argument(
+        "read_until",
+        default=None,
+        help="What character the string should read until",
+    )
+    parser.add_argument(
+        "strip",
+        type=boolean,
+        default=False,
+        help="If the string should be stripped of whitespaces and newlines before responding",
+    )
+
+    def get(self) -> dict:
+        all_rcv = self.conn.all_rcv()
+
+        # transpose in one pass; json encodes the tuples as arrays
+        timestamps, data = zip(*all_rcv) if all_rcv else ((), ())
+
+        return {
+            "message": "OK",
+            "timestamps": timestamps,
+            "data": data,
+        }
+
+    def post(self) -> dict:
+        args = self.parser.parse_args(strict=True)
+
+        if self.verbose:
+            _logger.debug("Arguments for /receive/all: %s", args)
+
+        all_rcv = self.conn.all_rcv(
+            read_until=args["read_until"], strip=args["strip"]
+        )
+
+        # transpose in one pass; json encodes the tuples as arrays
+        timestamps, data = zip(*all_rcv) if all_rcv else ((), ())
+
+        return {
+            "message": "OK",
+            "timestamps": timestamps,
+            "data": data,
+        }
+
+
+class _Get(_BuiltinResource):
+    """/get"""
+
+    parser = RequestParser()
+    parser.add_argument(
+        "read_until",
+        default=None,
+        help="What character the string should read until",
+    )
+    parser.add_argument(
+        "strip",
+        type=boolean,
+        default=False,
+        help="If the string should be stripped of whitespaces and newlines before responding",
+    )
+
+    def get(self) -> dict:
+        got = self.conn.get()
+
+        if got is None:
+            flask_restful.abort(502, message="Nothing received")
+
+        return {"message": "OK", "data": got}
+
+    def post(self) -> dict:
+        args = self.parser.parse_args(strict=True)
+
+        if self.verbose:
+            _logger.debug("Arguments for /get: %s", args)
+
+        got = self.conn.get(read_until=args["read_until"], strip=args["strip"])
+
+        if got is None:
+            flask_restful.abort(502, message="Nothing received")
+
+        return {"message": "OK", "data": got}
+
+
+class _GetFirst(_BuiltinResource):
+    """/send/get_first"""
+
+    parser = RequestParser()
+
+    parser.add_argument(
+        "data",
+        required=True,
+        action="append",
+        help="Data the serial port should send; is required",
+    )
+    parser.add_argument(
+        "ending",
+        default=DEFAULT_ENDING,
+        help="Ending that will be appended to the end of data before sending over serial port; default carriage return + newline",
+    )
+    parser.add_argument(
+        "concatenate",
+        default=DEFAULT_CONCATENATE,
+        help="What the strings in data should be concatenated by if list; by default a space",
+    )
+    parser.add_argument(
+        "read_until",
+        default=None,
+        help="What character the string should read until",
+    )
+    parser.add_argument(
+        "strip",
+        type=boolean,
+        default=False,
+        help="If the string should be stripped of whitespaces and newlines before responding",
+    )
+
+    def post(self) -> dict:
+        args = self.parser.parse_args(strict=True)
+
+        if self.verbose:
+            _logger.debug("Arguments for /send/get_first: %s", args)
+
+        res = self.conn.get_first_response(
+            *args["data"],
+            ending=args["ending"],
+            concatenate=args["concatenate"],
+            read_until=args["read_until"],
+            strip=args["strip"],
+        )
+
+        if res is None:
+            flask_restful.abort(502, message="Nothing received")
+
+        return {"message": "OK", "data": res}
+
+
+class _WaitResponse(_BuiltinResource):
+    """/get/wait"""
+
+    parser = RequestParser()
+
+    parser.add_argument(
+        "response",
+        required=True,
+        help="Which response the program should wait for; is required",
+    )
+    parser.add_argument(
+        "read_until",
+        default=None,
+        help="What character the string should read until",
+    )
+    parser.add_argument(
+        "strip",
+        type=boolean,
+        default=False,
+        help="If the string should be stripped of whitespaces and newlines before responding",
+    )
+
+    def post(self) -> flask.Response:
+        args = self.parser.parse_args(strict=True)
+
+        if self.verbose:
+            _logger.debug("Arguments for /get/wait: %s", args)
+
+        res = self.conn.wait_for_response(
+            response=args["response"],
+            read_until=args["read_until"],
+            strip=args["strip"],
+        )
+
+        if not res:
+            flask_restful.abort(502, message="Nothing received")
+
+        return ok()
+
+
+class _SendResponse(_BuiltinResource):
+    """/send/get"""
+
+    parser = RequestParser()
+
+    parser.add_argument(
+        "response",
+        required=True,
+        help="Which response the program should wait for; is required",
+    )
+    parser.add_argument(
+        "data",
+        required=True,
+        action="append",
+        help="Data the serial port should send; is required",
+    )
+    parser.add_argument(
+        "ending",
+        default=DEFAULT_ENDING,
+        help="Ending that will be appended to the end of data before sending over serial port; default carriage return + newline",
+    )
+    parser.add_argument(
+        "concatenate",
+        default=DEFAULT_CONCATENATE,
+        help="What the strings in data should be concatenated by if list; by default a space",
+    )
+    parser.add_argument(
+        "read_until",
+        default=None,
+        help="What character the string should read until",
+    )
+    parser.add_argument(
+        "strip",
+        type=boolean,
+        default=False,
+        help="If the string should be stripped of whitespaces and newlines before responding",
+    )
+
+    def post(self) -> flask.Response:
+        args = self.parser.parse_args(strict=True)
+
+        if self.verbose:
+            _logger.debug("Arguments for /send/get: %s", args)
+
+        res = self.conn.send_for_response(
+            args["response"],
+            *args["data"],
+            ending=args["ending"],
+            concatenate=args["concatenate"],
+            read_until=args["read_until"],
+            strip=args["strip"],
+        )
+
+        if not res:
+            flask_restful.abort(502, message="Nothing received")
+
+        return ok()
+
+
+class _ConnectionState(_BuiltinResource):
+    """/connection_state"""
+
+    def get(self) -> flask.Response:
+        conn = self.conn  # look up once rather than for every property
+
+        return conditional(
+            {
+                "message": "OK",
+                "state": {
+                    "timeout": conn.timeout,
+                    "send_interval": conn.send_interval,
+                    "available": conn.available,
+                    "port": conn.port,
+                },
+            },
+            max_age=1,
+        )
+
+
+class _GetConnectedState(_BuiltinResource):
+    """/connected"""
+
+    def get(self) -> flask.Response:
+        return conditional(
+            {"message": "OK", "connected": self.conn.connected}, max_age=1
+        )
+
+
+class _ListAll(_BuiltinResource):
+    """/list_ports"""
+
+    def get(self) -> flask.Response:
+        return conditional(
+            {
+                "message": "OK",
+                "ports": cached_ports(),  # listed at most once a second
+            },
+            max_age=5,
+        )
+
+
+# endpoints (without the version prefix) mapped to their resources
+_ENDPOINTS: t.Dict[str, t.Type[_BuiltinResource]] = {
+    "/send": _Sending,
+    "/receive": _Receiving,
+    "/receive/all": _ReceiveAll,
+    "/get": _Get,
+    "/send/get_first": _GetFirst,
+    "/get/wait": _WaitResponse,
+    "/send/get": _SendResponse,
+    "/connection_state": _ConnectionState,
+    "/connected": _GetConnectedState,
+    "/list_ports": _ListAll,
+}
 
 
 class Builtins:
@@ -40,7 +457,7 @@ class Builtins:
 
         Parameters:
         - `handler`: The `RestApiHandler` class that this class should wrap around
-        - `verbose`: Prints the arguments each endpoint receives to stdout. Should not be used in production. By default False.
+        - `verbose`: Prints the arguments each endpoint receives to stdout, through the `com_server.api.v0` logger. Should not be used in production. By default False.
         """
 
         if not isinstance(handler._conn, Connection):
@@ -51,425 +468,23 @@ class Builtins:
         self._handler = handler
         self._verbose = verbose
 
+        if verbose:
+            _init_verbose_logger()
+
         # version
         self._VERSION = "v0"
 
         # add all endpoints
         self._add_all()
 
-    def _add_all(self):
+    def _add_all(self) -> None:
         """Adds all endpoints to handler"""
 
         V = self._VERSION
 
-        # /send
-        self._handler.add_endpoint(f"/{V}/send")(self._send())
-
-        # /receive
-        self._handler.add_endpoint(f"/{V}/receive")(self._receive())
-
-        # /receive/all
-        self._handler.add_endpoint(f"/{V}/receive/all")(self._receive_all())
-
-        # /get
-        self._handler.add_endpoint(f"/{V}/get")(self._get())
-
-        # /send/get_first
-        self._handler.add_endpoint(f"/{V}/send/get_first")(self._get_first_response())
-
-        # /get/wait
-        self._handler.add_endpoint(f"/{V}/get/wait")(self._wait_for_response())
-
-        # /send/get
-        self._handler.add_endpoint(f"/{V}/send/get")(self._send_for_response())
-
-        # /connection_state
-        self._handler.add_endpoint(f"/{V}/connection_state")(self._connection_state())
-
-        # /connected
-        self._handler.add_endpoint(f"/{V}/connected")(self._connected())
-
-        # /list_ports
-        self._handler.add_endpoint(f"/{V}/list_ports")(self._list_all())
-
-    # keeping outside wrapper function for documentation
-    def _send(_self) -> t.Type[ConnectionResource]:
-        """/send"""
-
-        class _Sending(ConnectionResource):
-            # make parser once when class is declared, don't add arguments each time request is made aka don't put in post()
-            parser = reqparse.RequestParser()
-            parser.add_argument(
-                "data",
-                required=True,
-                action="append",
-                help="Data the serial port should send; is required",
-            )
-            parser.add_argument(
-                "ending",
-                default="\r\n",
-                help="Ending that will be appended to the end of data before sending over serial port; default carriage return + newline",
-            )
-            parser.add_argument(
-                "concatenate",
-                default=" ",
-                help="What the strings in data should be concatenated by if list; by default a space",
-            )
-
-            def post(self) -> dict:
-                args = self.parser.parse_args(strict=True)
-
-                if _self._verbose:
-                    print("Arguments for /send:", args)
-
-                # no need for check_type because everything will be parsed as a string
-                res = self.conn.send(
-                    *args["data"],
-                    ending=args["ending"],
-                    concatenate=args["concatenate"],
-                )
-
-                if not res:
-                    # abort if failed to send
-                    flask_restful.abort(502, message="Failed to send")
-
-                return {"message": "OK"}
-
-        return _Sending
-
-    def _receive(_self) -> t.Type[ConnectionResource]:
-        """/receive"""
-
-        class _Receiving(ConnectionResource):
-            parser = reqparse.RequestParser()
-            parser.add_argument(
-                "num_before", type=int, default=0, help="Which receive data to return"
-            )
-            parser.add_argument(
-                "read_until",
-                default=None,
-                help="What character the string should read until",
-            )
-            parser.add_argument(
-                "strip",
-                type=bool,
-                default=False,
-                help="If the string should be stripped of whitespaces and newlines before responding",
-            )
-
-            def get(self) -> dict:
-                res = self.conn.receive_str()
-
-                return {
-                    "message": "OK",
-                    "timestamp": res[0] if isinstance(res, tuple) else None,
-                    "data": res[1] if isinstance(res, tuple) else None,
-                }
-
-            def post(self) -> dict:
-                args = self.parser.parse_args(strict=True)
-
-                if _self._verbose:
-                    print("Arguments for /receive:", args)
-
-                res = self.conn.receive_str(
-                    num_before=args["num_before"],
-                    read_until=args["read_until"],
-                    strip=args["strip"],
-                )
-
-                return {
-                    "message": "OK",
-                    "timestamp": res[0] if isinstance(res, tuple) else None,
-                    "data": res[1] if isinstance(res, tuple) else None,
-                }
-
-        return _Receiving
-
-    def _receive_all(_self) -> t.Type[ConnectionResource]:
-        """/receive/all"""
-
-        class _ReceiveAll(ConnectionResource):
-
-            parser = reqparse.RequestParser()
-            parser.add_argument(
-                "read_until",
-                default=None,
-                help="What character the string should read until",
-            )
-            parser.add_argument(
-                "strip",
-                type=bool,
-                default=False,
-                help="If the string should be stripped of whitespaces and newlines before responding",
-            )
-
-            def get(self) -> dict:
-                all_rcv = self.conn.all_rcv()
-
-                return {
-                    "message": "OK",
-                    "timestamps": [ts for ts, _ in all_rcv],
-                    "data": [data for _, data in all_rcv],
-                }
-
-            def post(self) -> dict:
-                args = self.parser.parse_args(strict=True)
-
-                if _self._verbose:
-                    print("Arguments for /receive/all:", args)
-
-                all_rcv = self.conn.all_rcv(
-                    read_until=args["read_until"], strip=args["strip"]
-                )
-
-                return {
-                    "message": "OK",
-                    "timestamps": [ts for ts, _ in all_rcv],
-                    "data": [data for _, data in all_rcv],
-                }
-
-        return _ReceiveAll
-
-    def _get(_self) -> t.Type[ConnectionResource]:
-        """/get"""
-
-        class _Get(ConnectionResource):
-
-            parser = reqparse.RequestParser()
-            parser.add_argument(
-                "read_until",
-                default=None,
-                help="What character the string should read until",
-            )
-            parser.add_argument(
-                "strip",
-                type=bool,
-                default=False,
-                help="If the string should be stripped of whitespaces and newlines before responding",
-            )
-
-            def get(self) -> dict:
-                got = self.conn.get()
-
-                if got is None:
-                    flask_restful.abort(502, message="Nothing received")
-
-                return {"message": "OK", "data": got}
-
-            def post(self) -> dict:
-                args = self.parser.parse_args(strict=True)
-
-                if _self._verbose:
-                    print("Arguments for /get:", args)
-
-                got = self.conn.get(read_until=args["read_until"], strip=args["strip"])
-
-                if got is None:
-                    flask_restful.abort(502, message="Nothing received")
-
-                return {"message": "OK", "data": got}
-
-        return _Get
-
-    def _get_first_response(_self) -> t.Type[ConnectionResource]:
-        """/send/get_first"""
-
-        class _GetFirst(ConnectionResource):
-
-            parser = reqparse.RequestParser()
-
-            parser.add_argument(
-                "data",
-                required=True,
-                action="append",
-                help="Data the serial port should send; is required",
-            )
-            parser.add_argument(
-                "ending",
-                default="\r\n",
-                help="Ending that will be appended to the end of data before sending over serial port; default carriage return + newline",
-            )
-            parser.add_argument(
-                "concatenate",
-                default=" ",
-                help="What the strings in data should be concatenated by if list; by default a space",
-            )
-            parser.add_argument(
-                "read_until",
-                default=None,
-                help="What character the string should read until",
-            )
-            parser.add_argument(
-                "strip",
-                type=bool,
-                default=False,
-                help="If the string should be stripped of whitespaces and newlines before responding",
-            )
-
-            def post(self) -> dict:
-                args = self.parser.parse_args(strict=True)
-
-                if _self._verbose:
-                    print("Arguments for /send/get_first:", args)
-
-                res = self.conn.get_first_response(
-                    *args["data"],
-                    ending=args["ending"],
-                    concatenate=args["concatenate"],
-                    read_until=args["read_until"],
-                    strip=args["strip"],
-                )
-
-                if res is None:
-                    flask_restful.abort(502, message="Nothing received")
-
-                return {"message": "OK", "data": res}
-
-        return _GetFirst
-
-    def _wait_for_response(_self) -> t.Type[ConnectionResource]:
-        """/get/wait"""
-
-        class _WaitResponse(ConnectionResource):
-
-            parser = reqparse.RequestParser()
-
-            parser.add_argument(
-                "response",
-                required=True,
-                help="Which response the program should wait for; is required",
-            )
-            parser.add_argument(
-                "read_until",
-                default=None,
-                help="What character the string should read until",
-            )
-            parser.add_argument(
-                "strip",
-                type=bool,
-                default=False,
-                help="If the string should be stripped of whitespaces and newlines before responding",
-            )
-
-            def post(self) -> dict:
-                args = self.parser.parse_args(strict=True)
-
-                if _self._verbose:
-                    print("Arguments for /get/wait:", args)
-
-                res = self.conn.wait_for_response(
-                    response=args["response"],
-                    read_until=args["read_until"],
-                    strip=args["strip"],
-                )
-
-                if not res:
-                    flask_restful.abort(502, message="Nothing received")
-
-                return {"message": "OK"}
-
-        return _WaitResponse
-
-    def _send_for_response(_self) -> t.Type[ConnectionResource]:
-        """/send/get"""
-
-        class _SendResponse(ConnectionResource):
-
-            parser = reqparse.RequestParser()
-
-            parser.add_argument(
-                "response",
-                required=True,
-                help="Which response the program should wait for; is required",
-            )
-            parser.add_argument(
-                "data",
-                required=True,
-                action="append",
-                help="Data the serial port should send; is required",
-            )
-            parser.add_argument(
-                "ending",
-                default="\r\n",
-                help="Ending that will be appended to the end of data before sending over serial port; default carriage return + newline",
-            )
-            parser.add_argument(
-                "concatenate",
-                default=" ",
-                help="What the strings in data should be concatenated by if list; by default a space",
+        for endpoint, resource in _ENDPOINTS.items():
+            # the handler sets the connection on and wraps the methods of the class it is given,
+            # so give it a subclass rather than changing the class shared by all `Builtins` objects
+            self._handler.add_endpoint(f"/{V}{endpoint}")(
+                type(resource.__name__, (resource,), {"verbose": self._verbose})
             )
-            parser.add_argument(
-                "read_until",
-                default=None,
-                help="What character the string should read until",
-            )
-            parser.add_argument(
-                "strip",
-                type=bool,
-                default=False,
-                help="If the string should be stripped of whitespaces and newlines before responding",
-            )
-
-            def post(self) -> dict:
-                args = self.parser.parse_args(strict=True)
-
-                if _self._verbose:
-                    print("Arguments for /send/get:", args)
-
-                res = self.conn.send_for_response(
-                    args["response"],
-                    *args["data"],
-                    ending=args["ending"],
-                    concatenate=args["concatenate"],
-                    read_until=args["read_until"],
-                    strip=args["strip"],
-                )
-
-                if not res:
-                    flask_restful.abort(502, message="Nothing received")
-
-                return {"message": "OK"}
-
-        return _SendResponse
-
-    def _connection_state(_self) -> t.Type[Connection]:
-        """/connection_state"""
-
-        class _ConnectionState(ConnectionResource):
-            def get(self) -> dict:
-                return {
-                    "message": "OK",
-                    "state": {
-                        "timeout": self.conn.timeout,
-                        "send_interval": self.conn.send_interval,
-                        "available": self.conn.available,
-                        "port": self.conn.port,
-                    },
-                }
-
-        return _ConnectionState
-
-    def _connected(_self) -> t.Type[Connection]:
-        """/connected"""
-
-        class _GetConnectedState(ConnectionResource):
-            def get(self) -> dict:
-                return {"message": "OK", "connected": self.conn.connected}
-
-        return _GetConnectedState
-
-    # both throwaway as connection not needed
-    def _list_all(_self) -> t.Type[ConnectionResource]:
-        """/list_ports"""
-
-        class _ListAll(ConnectionResource):
-            def get(self) -> dict:
-                res = all_ports()
-
-                return {
-                    "message": "OK",
-                    "ports": [[port, desc, tech] for port, desc, tech in res],
-                }
-
-        return _ListAll
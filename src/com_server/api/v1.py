@@ -7,9 +7,40 @@ Version 1 of Builtin API. All endpoints below will be prefixed with /v1/ and can
 
 import typing as t
 
-from flask_restful import reqparse, abort
+import flask
+from flask_restful import abort
 
-from .. import ConnectionResource, ConnectionRoutes, all_ports
+from .. import ConnectionResource, ConnectionRoutes
+from ..constants import DEFAULT_CONCATENATE, DEFAULT_ENDING
+from ..tools import cached_ports
+from .parser import RequestParser
+from .responses import conditional
+
+
+class _BatchItem(t.NamedTuple):
+    """An item given to /send/batch"""
+
+    data: t.List[str]
+    ending: str
+    concatenate: str
+
+
+def _batch_item(item: t.Any) -> _BatchItem:
+    """Converts an item given to /send/batch to the arguments it will be sent with"""
+
+    if not isinstance(item, dict) or "data" not in item:
+        raise ValueError("Each item must be an object with data")
+
+    data = item["data"] if isinstance(item["data"], list) else [item["data"]]
+    if not data:
+        raise ValueError("Each item must have data to send")
+
+    # converted to str like the arguments of /send
+    return _BatchItem(
+        [str(i) for i in data],
+        str(item.get("ending", DEFAULT_ENDING)),
+        str(item.get("concatenate", DEFAULT_CONCATENATE)),
+    )
 
 
 class V1:
@@ -39,6 +70,7 @@ class V1:
 
         _endpoint_map = {
             "/send": self._Sender,
+            "/send/batch": self._Batch_Sender,
             "/receive/<int:num_before>": self._Receiver,
             "/receive": self._All_Received,
             "/get": self._Get,
@@ -54,7 +86,7 @@ class V1:
     class _Sender(ConnectionResource):
         """/send"""
 
-        parser = reqparse.RequestParser()
+        parser = RequestParser()
         parser.add_argument(
             "data",
             required=True,
@@ -63,12 +95,12 @@ class V1:
         )
         parser.add_argument(
             "ending",
-            default="\r\n",
+            default=DEFAULT_ENDING,
             help="Ending that will be appended to the end of data before sending over serial port; default carriage return + newline",
         )
         parser.add_argument(
             "concatenate",
-            default=" ",
+            default=DEFAULT_CONCATENATE,
             help="What the strings in data should be concatenated by if list; by default a space",
         )
 
@@ -88,20 +120,53 @@ class V1:
 
             return {"message": "OK", "data": args}
 
+    class _Batch_Sender(ConnectionResource):
+        """/send/batch"""
+
+        parser = RequestParser()
+        parser.add_argument(
+            "items",
+            required=True,
+            action="append",
+            type=_batch_item,
+            help="Objects with data to send to serial port, and optionally ending and concatenate.",
+        )
+
+        def post(self) -> dict:
+            args = self.parser.parse_args(strict=True)
+
+            # each item is processed the way `send()` processes its arguments
+            items = [
+                self.conn.format_send(
+                    *item.data, ending=item.ending, concatenate=item.concatenate
+                )
+                for item in args["items"]
+            ]
+
+            # send everything together so that it is one object in the send queue
+            # and is written to the serial port at once, rather than one request each
+            res = self.conn.send(
+                "".join(items), check_type=False, ending="", concatenate=""
+            )
+
+            if not res:
+                return {"message": "Failed to send"}
+
+            return {"message": "OK", "data": {"items": items}}
+
     class _Receiver(ConnectionResource):
         """/receive/<int:num_before>"""
 
         def get(self, num_before: int) -> dict:
             res = self.conn.receive_str(num_before=num_before)
 
-            if not isinstance(res, tuple):
+            if res is None:
                 abort(404, message="Receive item not found")
 
-            return {
-                "message": "OK",
-                "timestamp": res[0] if isinstance(res, tuple) else None,
-                "data": res[1] if isinstance(res, tuple) else None,
-            }
+            # `abort` raises, but is untyped, so `res` is not narrowed for type checkers
+            timestamp, data = t.cast(t.Tuple[float, str], res)
+
+            return {"message": "OK", "timestamp": timestamp, "data": data}
 
     class _All_Received(ConnectionResource):
         """/receive"""
@@ -109,10 +174,13 @@ class V1:
         def get(self) -> dict:
             all_rcv = self.conn.all_rcv()
 
+            # transpose in one pass; json encodes the tuples as arrays
+            timestamps, data = zip(*all_rcv) if all_rcv else ((), ())
+
             return {
                 "message": "OK",
-                "timestamps": [ts for ts, _ in all_rcv],
-                "data": [data for _, data in all_rcv],
+                "timestamps": timestamps,
+                "data": data,
             }
 
     class _Get(ConnectionResource):
@@ -129,7 +197,7 @@ class V1:
     class _Get_First(ConnectionResource):
         """/first_response"""
 
-        parser = reqparse.RequestParser()
+        parser = RequestParser()
 
         parser.add_argument(
             "data",
@@ -139,12 +207,12 @@ class V1:
         )
         parser.add_argument(
             "ending",
-            default="\r\n",
+            default=DEFAULT_ENDING,
             help="Ending that will be appended to the end of data before sending over serial port; default carriage return + newline",
         )
         parser.add_argument(
             "concatenate",
-            default=" ",
+            default=DEFAULT_CONCATENATE,
             help="What the strings in data should be concatenated by if list; by default a space",
         )
 
@@ -165,7 +233,7 @@ class V1:
     class _Send_Until(ConnectionResource):
         """/send_until"""
 
-        parser = reqparse.RequestParser()
+        parser = RequestParser()
 
         parser.add_argument(
             "response",
@@ -180,12 +248,12 @@ class V1:
         )
         parser.add_argument(
             "ending",
-            default="\r\n",
+            default=DEFAULT_ENDING,
             help="Ending that will be appended to the end of data before sending over serial port; default carriage return + newline",
         )
         parser.add_argument(
             "concatenate",
-            default=" ",
+            default=DEFAULT_CONCATENATE,
             help="What the strings in data should be concatenated by if list; by default a space",
         )
 
@@ -207,25 +275,31 @@ class V1:
     class _Connection_State(ConnectionResource):
         """/connection_state"""
 
-        def get(self) -> dict:
-            return {
-                "message": "OK",
-                "state": {
-                    "connected": self.conn.connected,
-                    "timeout": self.conn.timeout,
-                    "send_interval": self.conn.send_interval,
-                    "available": self.conn.available,
-                    "port": self.conn.port,
+        def get(self) -> flask.Response:
+            conn = self.conn  # look up once rather than for every property
+
+            return conditional(
+                {
+                    "message": "OK",
+                    "state": {
+                        "connected": conn.connected,
+                        "timeout": conn.timeout,
+                        "send_interval": conn.send_interval,
+                        "available": conn.available,
+                        "port": conn.port,
+                    },
                 },
-            }
+                max_age=1,
+            )
 
     class _All_Ports(ConnectionResource):
         """/all_ports"""
 
-        def get(self) -> dict:
-            res = all_ports()
-
-            return {
-                "message": "OK",
-                "ports": [[port, desc, tech] for port, desc, tech in res],
-            }
+        def get(self) -> flask.Response:
+            return conditional(
+                {
+                    "message": "OK",
+                    "ports": cached_ports(),  # listed at most once a second
+                },
+                max_age=5,
+            )
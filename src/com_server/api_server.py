@@ -6,6 +6,7 @@ This file contains the implementation to the HTTP server that serves
 the web API for the Serial port.
 """
 
+import inspect
 import logging
 import threading
 import typing as t
@@ -23,6 +24,70 @@ class EndpointExistsException(Exception):
     pass
 
 
+class _SharedLock:
+    """A lock that can be held by many shared holders or by one exclusive holder.
+
+    Acquiring never blocks; it fails if the lock cannot be taken right away.
+    """
+
+    def __init__(self) -> None:
+        self._state_lock = threading.Lock()  # guards the two attributes below
+        self._shared = 0  # number of shared holders
+        self._exclusive = False  # if there is an exclusive holder
+
+    def acquire(self, shared: bool = False) -> bool:
+        """Tries to acquire the lock without blocking.
+
+        Parameters:
+        - `shared` (bool): If True, the lock is acquired along with other shared holders. By default False.
+
+        Returns True if the lock was acquired, False if it is held in a way that conflicts.
+        """
+
+        with self._state_lock:
+            if self._exclusive or (not shared and self._shared):
+                return False
+
+            if shared:
+                self._shared += 1
+            else:
+                self._exclusive = True
+
+            return True
+
+    def release(self, shared: bool = False) -> None:
+        """Releases the lock.
+
+        Parameters:
+        - `shared` (bool): If the lock was acquired as shared. By default False.
+        """
+
+        with self._state_lock:
+            if shared:
+                self._shared -= 1
+            else:
+                self._exclusive = False
+
+
+# methods of resources that `RestApiHandler` checks before calling
+_WRAPPED_METHODS = ("get", "post", "head", "put", "delete")
+_READ_METHODS = ("get", "head")  # can share the connection if `shared_reads` is True
+
+
+def _cache_not_found(response: flask.Response) -> flask.Response:
+    """
+    Lets clients and proxies cache `404 Not Found` responses
+    to URLs that do not match any endpoint
+    """
+
+    if response.status_code == 404 and flask.request.url_rule is None:
+        # not a 404 from a resource, which may be found later
+        response.cache_control.public = True
+        response.cache_control.max_age = 1
+
+    return response
+
+
 class ConnectionResource(flask_restful.Resource):
     """A custom resource object that is built to be used with `RestApiHandler` and `ConnectionRoutes`.
 
@@ -55,7 +120,8 @@ class RestApiHandler:
 
     If another process accesses an endpoint while another is
     currently being used, then it will respond with
-    `503 Service Unavailable`.
+    `503 Service Unavailable`. If `shared_reads` is True,
+    GET and HEAD requests can use endpoints at the same time.
 
     More information on [Flask](https://flask.palletsprojects.com/en/2.0.x/) and [flask-restful](https://flask-restful.readthedocs.io/en/latest/).
 
@@ -75,6 +141,7 @@ class RestApiHandler:
         has_register_recall: bool = True,
         add_cors: bool = False,
         catch_all_404s: bool = True,
+        shared_reads: bool = False,
         **kwargs: t.Any,
     ) -> None:
         """Constructor for class
@@ -87,15 +154,24 @@ class RestApiHandler:
         accessed. By default True.
         - `add_cors` (bool): If True, then the Flask app will have [cross origin resource sharing](https://developer.mozilla.org/en-US/docs/Web/HTTP/CORS) enabled. By default False.
         - `catch_all_404s` (bool): If True, then there will be JSON response for 404 errors. Otherwise, there will be a normal HTML response on 404. By default True.
+        - `shared_reads` (bool): If True, then GET and HEAD requests can use the endpoints at the same time as each other,
+        and only respond with `503` while a request of another method (such as POST) is being handled. GET and HEAD methods
+        of resources should then only read from the `Connection` object. By default False.
         - `**kwargs`, will be passed to `flask_restful.Api()`. See [here](https://flask-restful.readthedocs.io/en/latest/api.html#id1) for more info.
         """
 
         # from above
         self._conn = conn
         self._has_register_recall = has_register_recall
+        self._shared_reads = shared_reads
 
         # flask, flask_restful
         self._app = flask.Flask(__name__)
+
+        # compact JSON responses; flask_restful encodes with the json module's
+        # C encoder unless it has to indent them
+        self._app.config["RESTFUL_JSON"] = {"separators": (",", ":")}
+
         self._api = flask_restful.Api(
             self._app, catch_all_404s=catch_all_404s, **kwargs
         )
@@ -103,15 +179,21 @@ class RestApiHandler:
         if add_cors:
             CORS(self._app)
 
+        self._app.after_request(_cache_not_found)
+
         # other
-        self._all_endpoints: t.List[
-            t.Tuple[str, t.Type[ConnectionResource]]
-        ] = []  # list of all endpoints in tuple (endpoint str, resource class)
+        self._all_endpoints: t.Dict[
+            str, t.Type[ConnectionResource]
+        ] = {}  # resource class of each endpoint, keyed by endpoint str
+        self._resource_names: t.Set[str] = set()  # names of resources in `_all_endpoints`
         self._registered: t.Optional[
             str
         ] = None  # keeps track of who is registered; None if not registered
-        self._lock = (
+        self._registered_lock = (
             threading.Lock()
+        )  # so that /register and /recall check and set `_registered` together
+        self._lock = (
+            _SharedLock()
         )  # for making sure only one thread is accessing Connection obj at a time
 
         if has_register_recall:
@@ -132,7 +214,10 @@ class RestApiHandler:
         """Decorator that adds an endpoint
 
         This decorator should go above a class that
-        extends `ConnectionResource`. The class should
+        extends `ConnectionResource` (or above a function
+        that takes no arguments and returns such a class,
+        in which case the function is only called once
+        when the endpoint is added). The class should
         contain implementations of request methods such as
         `get()`, `post()`, etc. similar to the `Resource`
         class from `flask_restful`. To use the connection
@@ -152,7 +237,8 @@ class RestApiHandler:
 
         If another process accesses an endpoint while another is
         currently being used, then it will respond with
-        `503 Service Unavailable`.
+        `503 Service Unavailable`, unless both are GET or HEAD
+        requests and `shared_reads` was True in the constructor.
 
         Parameters:
         - `endpoint` (str): The endpoint to the resource. Cannot repeat.
@@ -164,8 +250,7 @@ class RestApiHandler:
             """Checks endpoint and resource"""
 
             # check if endpoint exists already
-            check = [i for i, _ in self._all_endpoints]
-            if endpoint in check:
+            if endpoint in self._all_endpoints:
                 raise EndpointExistsException(f'Endpoint "{endpoint}" already exists')
 
             # check that resource is not None, if it is, did not return class
@@ -179,62 +264,79 @@ class RestApiHandler:
                 raise TypeError("resource has to extend com_server.ConnectionResource")
 
             # check if resource name is taken, if so, change it (flask_restful interperets duplicate names as multiple endpoints)
-            names = [i.__name__ for _, i in self._all_endpoints]
-            if resource.__name__ in names:
+            if resource.__name__ in self._resource_names:
                 s = f"{resource.__name__}"
 
-                while s in names:
+                while s in self._resource_names:
                     # append underscore until no matching
                     s += "_"
 
                 resource.__name__ = s
 
-        def _outer(resource: t.Type[ConnectionResource]) -> t.Type:
+        def _outer(
+            resource: t.Union[
+                t.Type[ConnectionResource], t.Callable[[], t.Type[ConnectionResource]]
+            ]
+        ) -> t.Type[ConnectionResource]:
+            if not inspect.isclass(resource) and callable(resource):
+                # function that returns the resource class; call it once
+                # here so the class is not rebuilt later
+                resource = resource()
+
+            # `_checks` makes sure that this is actually a resource class
+            resource = t.cast(t.Type[ConnectionResource], resource)
+
             # checks; will raise exception if fails
             _checks(resource)
 
             # assign connection obj
             resource.conn = self._conn
 
+            # looked up once here rather than on `self` in every request
+            lock = self._lock
+
             # req methods; _self is needed as these will be part of class functions
-            def _dec(func: t.Callable) -> t.Callable:
+            def _dec(func: t.Callable, shared: bool = False) -> t.Callable:
                 def _inner(_self, *args: t.Any, **kwargs: t.Any) -> t.Any:
-                    ip = flask.request.remote_addr
-
-                    if self._has_register_recall and (
-                        not self._registered or self._registered != ip
-                    ):
-                        # respond with 400 if not registered
-                        flask_restful.abort(
-                            400, message="Not registered; only one connection at a time"
-                        )
-                    elif self._lock.locked():
+                    if not lock.acquire(shared):
                         # if another endpoint is currently being used
                         flask_restful.abort(
                             503,
                             message="An endpoint is currently in use by another process.",
                         )
-                    else:
-                        with self._lock:
-                            val = func(_self, *args, **kwargs)
 
-                    return val
+                    try:
+                        return func(_self, *args, **kwargs)
+                    finally:
+                        lock.release(shared)
+
+                if not self._has_register_recall:
+                    # nothing to check before using the connection
+                    return _inner
+
+                def _inner_registered(_self, *args: t.Any, **kwargs: t.Any) -> t.Any:
+                    registered = self._registered  # may be changed by /recall
+
+                    if not registered or registered != flask.request.remote_addr:
+                        # respond with 400 if not registered
+                        flask_restful.abort(
+                            400, message="Not registered; only one connection at a time"
+                        )
+
+                    return _inner(_self, *args, **kwargs)
 
-                return _inner
+                return _inner_registered
 
             # replace functions in class with new functions that check if registered
-            if hasattr(resource, "get"):
-                resource.get = _dec(resource.get)
-            if hasattr(resource, "post"):
-                resource.post = _dec(resource.post)
-            if hasattr(resource, "head"):
-                resource.head = _dec(resource.head)
-            if hasattr(resource, "put"):
-                resource.put = _dec(resource.put)
-            if hasattr(resource, "delete"):
-                resource.delete = _dec(resource.delete)
-
-            self._all_endpoints.append((endpoint, resource))
+            for method in _WRAPPED_METHODS:
+                if hasattr(resource, method):
+                    shared = self._shared_reads and method in _READ_METHODS
+                    setattr(resource, method, _dec(getattr(resource, method), shared))
+
+            self._api.add_resource(resource, endpoint)
+
+            self._all_endpoints[endpoint] = resource
+            self._resource_names.add(resource.__name__)
 
             return resource
 
@@ -279,18 +381,18 @@ class RestApiHandler:
         if not self._conn.connected:
             self._conn.connect()  # connect the Connection obj if not connected
 
-        # register all endpoints to flask_restful
-        for endpoint, resource in self._all_endpoints:
-            self._api.add_resource(resource, endpoint)
-
         # add disconnect handler, verbose is True
         _logger = logging.getLogger("com_server_dev")
         _disconnect_handler = disconnect.Reconnector(self._conn, _logger, logfile)
         _disconnect_handler.start()
 
-        self._app.run(**kwargs)
+        # sort and compile the routes now rather than in the first request
+        self._app.url_map.update()
 
-        self._conn.disconnect()  # disconnect if stop running
+        try:
+            self._app.run(**kwargs)
+        finally:
+            self._stop(_disconnect_handler)
 
     def run(self, logfile: t.Optional[str] = None, **kwargs: t.Any) -> None:
         """Launches the Flask app as a Waitress production server (recommended).
@@ -312,23 +414,32 @@ class RestApiHandler:
         if not self._conn.connected:
             self._conn.connect()  # connect the Connection obj if not connected
 
-        # register all endpoints to flask_restful
-        for endpoint, resource in self._all_endpoints:
-            self._api.add_resource(resource, endpoint)
-
         _logger = logging.getLogger("waitress")
 
         # add disconnect handler, verbose is False
         _disconnect_handler = disconnect.Reconnector(self._conn, _logger, logfile)
         _disconnect_handler.start()
 
-        waitress.serve(self._app, **kwargs)
+        # sort and compile the routes now rather than in the first request
+        self._app.url_map.update()
 
-        self._conn.disconnect()  # disconnect if stop running
+        try:
+            waitress.serve(self._app, **kwargs)
+        finally:
+            self._stop(_disconnect_handler)
 
     # backward compatibility
     run_prod = run
 
+    def _stop(self, disconnect_handler: disconnect.Reconnector) -> None:
+        """Stops the disconnect handler, then disconnects the `Connection` object"""
+
+        # stop first so that the handler does not reconnect after disconnecting
+        disconnect_handler.stop()
+        disconnect_handler.join(timeout=1)
+
+        self._conn.disconnect()
+
     @property
     def flask_obj(self) -> flask.Flask:
         """
@@ -372,16 +483,18 @@ class RestApiHandler:
             def get(_self) -> dict:
                 ip = flask.request.remote_addr
 
-                # check if already registered
-                if self._registered:
-                    if self._registered == ip:
-                        flask_restful.abort(400, message="Double registration")
-                    else:
-                        flask_restful.abort(
-                            400, message="Not registered; only one connection at a time"
-                        )
+                with self._registered_lock:
+                    # check if already registered
+                    if self._registered:
+                        if self._registered == ip:
+                            flask_restful.abort(400, message="Double registration")
+                        else:
+                            flask_restful.abort(
+                                400,
+                                message="Not registered; only one connection at a time",
+                            )
 
-                self._registered = ip
+                    self._registered = ip
 
                 return {"message": "OK"}
 
@@ -407,15 +520,18 @@ class RestApiHandler:
             def get(_self) -> dict:
                 ip = flask.request.remote_addr
 
-                # check if not registered
-                if not self._registered:
-                    flask_restful.abort(400, message="Nothing has been registered")
+                with self._registered_lock:
+                    # check if not registered
+                    if not self._registered:
+                        flask_restful.abort(400, message="Nothing has been registered")
 
-                # check if ip matches
-                if ip != self._registered:
-                    flask_restful.abort(400, message="Not same user as one in session")
+                    # check if ip matches
+                    if ip != self._registered:
+                        flask_restful.abort(
+                            400, message="Not same user as one in session"
+                        )
 
-                self._registered = None
+                    self._registered = None
 
                 return {"message": "OK"}
 
@@ -11,6 +11,7 @@ import os
 import threading
 import time
 import typing as t
+import warnings
 from types import TracebackType
 
 import serial
@@ -36,6 +37,33 @@ class BaseConnection(abc.ABC):
     and `disconnect()`, properties of the connection, and an abstract IO thread method.
     """
 
+    # no per-instance __dict__; subclasses that add attributes must extend this
+    __slots__ = (
+        "_baud",
+        "_port",
+        "_ports",
+        "_ports_list",
+        "_exception",
+        "_timeout",
+        "_pass_to_pyserial",
+        "_queue_size",
+        "_send_interval",
+        "_exit_on_disconnect",
+        "_rest_cpu",
+        "_low_latency",
+        "_conn",
+        "_last_sent",
+        "_last_rcv",
+        "_rcv_queue",
+        "_to_send",
+        "_lock",
+        "_rcv_cond",
+        "_rcv_count",
+        "_send_event",
+        "_wake_fds",
+        "__weakref__",  # so that objects can still be weakly referenced
+    )
+
     def __init__(
         self,
         baud: int,
@@ -47,6 +75,7 @@ class BaseConnection(abc.ABC):
         queue_size: int = constants.RCV_QUEUE_SIZE_NORMAL,
         exit_on_disconnect: bool = False,
         rest_cpu: bool = True,
+        low_latency: bool = False,
         **kwargs: t.Any,
     ) -> None:
         """Initializes BaseConnection and Connection-like classes
@@ -67,6 +96,12 @@ class BaseConnection(abc.ABC):
             exit_on_disconnect (bool, optional): If True, sends `SIGTERM` signal to the main thread if the serial port is disconnected. Does not work on Windows. Defaults to False.
             rest_cpu (bool, optional): If True, will add 0.01 second delay to end of IO thread. Otherwise, removes those delays but will result in increased CPU usage. \
             Not recommended to set to False with the default IO thread. Defaults to True.
+            low_latency (bool, optional): If True, sets the `ASYNC_LOW_LATENCY` flag on the serial port after connecting, which \
+            makes drivers such as FTDI and CDC-ACM pass received data on immediately instead of buffering it for up to 16 ms. \
+            Only supported on Linux; ignored with a `RuntimeWarning` on other platforms or if the driver or permissions do not allow it. \
+            On Windows, the FTDI latency timer can be lowered in Device Manager (Port Settings > Advanced > Latency Timer) \
+            or with the `LatencyTimer` value in the registry under \
+            `HKEY_LOCAL_MACHINE\\SYSTEM\\CurrentControlSet\\Enum\\FTDIBUS\\<device>\\0000\\Device Parameters`. Defaults to False.
             **kwargs (Any): Passed to pyserial
 
         Raises:
@@ -85,6 +120,7 @@ class BaseConnection(abc.ABC):
         self._send_interval = abs(float(send_interval))  # make sure positive
         self._exit_on_disconnect = exit_on_disconnect
         self._rest_cpu = rest_cpu
+        self._low_latency = low_latency
 
         if os.name == "nt" and self._exit_on_disconnect:
             raise EnvironmentError("exit_on_fail is not supported on Windows")
@@ -93,7 +129,7 @@ class BaseConnection(abc.ABC):
         self._conn: t.Optional[serial.Serial] = None
 
         # other
-        self._last_sent = time.time()  # prevents from sending too rapidly
+        self._last_sent = time.monotonic()  # prevents from sending too rapidly
         self._last_rcv = (
             0.0,
             b"",
@@ -111,13 +147,36 @@ class BaseConnection(abc.ABC):
         # and send queue are written to and read safely
         self._lock = threading.Lock()
 
+        # notified by the IO thread whenever new data is received
+        # so that methods waiting for data do not have to poll
+        self._rcv_cond = threading.Condition()
+        self._rcv_count = 0  # number of times new data has been received
+
+        # set when data is added to the send queue so that
+        # the IO thread can stop resting and send it right away
+        self._send_event = threading.Event()
+
+        # pipe that wakes the IO thread while it waits on the serial port (posix only);
+        # created when connecting and kept until the object is deleted
+        self._wake_fds: t.Optional[t.Tuple[int, int]] = None
+
+    def __del__(self) -> None:
+        """
+        Closes the pipe used to wake up the IO thread
+        """
+
+        wake_fds = getattr(self, "_wake_fds", None)
+        if wake_fds is not None:
+            for fd in wake_fds:
+                os.close(fd)
+
     def __repr__(self) -> str:
         """
         Returns string representation of self
         """
 
         return (
-            f"Connection<id=0x{hex(id(self))}>"
+            f"Connection<id={id(self):#x}>"
             f"{{Serial={self._conn}, "
             f"timeout={self._timeout}, max_queue_size={self._queue_size}, send_interval={self._send_interval}}}"
         )
@@ -190,6 +249,14 @@ class BaseConnection(abc.ABC):
             **self._pass_to_pyserial,
         )
 
+        if self._low_latency:
+            self._set_low_latency(self._conn)
+
+        if os.name == "posix" and self._wake_fds is None:
+            self._wake_fds = os.pipe()
+            for fd in self._wake_fds:
+                os.set_blocking(fd, False)
+
         # clear buffers
         self._conn.flush()
         self._conn.flushInput()
@@ -222,6 +289,9 @@ class BaseConnection(abc.ABC):
         self._reset()
         self._conn = None
 
+        # make the IO thread stop waiting so that it exits
+        self._wake_io()
+
     def send(
         self,
         *data: t.Any,
@@ -272,19 +342,16 @@ class BaseConnection(abc.ABC):
             raise ConnectException("No connection established")
 
         # check if it should send by using send_interval.
-        if time.time() - self._last_sent <= self._send_interval:
-            return False
-        self._last_sent = time.time()
-
-        # check `check_type`, then converts each element
-        send_data: str = ""
-        if check_type:
-            send_data = concatenate.join([self._check_output(i) for i in data])
-        else:
-            send_data = concatenate.join([str(i) for i in data])
+        # monotonic so that changes to the system clock do not affect the interval
+        if self._send_interval > 0:
+            now = time.monotonic()
+            if now - self._last_sent <= self._send_interval:
+                return False
+            self._last_sent = now
 
-        # add ending to string
-        send_data_bytes = (send_data + ending).encode("utf-8")
+        send_data_bytes = self.format_send(
+            *data, check_type=check_type, ending=ending, concatenate=concatenate
+        ).encode("utf-8")
 
         # make sure nothing is reading/writing to the receive queue
         # while reading/assigning the variable
@@ -293,8 +360,43 @@ class BaseConnection(abc.ABC):
                 # only append if limit has not been reached
                 self._to_send.append(send_data_bytes)
 
+        # wake up the IO thread
+        self._wake_io()
+
         return True
 
+    def format_send(
+        self,
+        *data: t.Any,
+        check_type: bool = True,
+        ending: str = "\r\n",
+        concatenate: str = " ",
+    ) -> str:
+        """Makes the string that `send()` would send for the same arguments, without sending it
+
+        This can be used to combine several pieces of data that are processed like `send()`
+        into a single string, which can then be sent at once with `send(..., check_type=False, ending="")`.
+
+        Args:
+            `*data` (Any): Everything that is to be sent, each as a separate parameter.
+            check_type (bool, optional): If True, processes each argument like `send()` does. \
+            Otherwise, converts each argument directly to `str`. Defaults to True.
+            ending (str, optional): The ending of the string. Defaults to "\\r\\n".
+            concatenate (str, optional): What the strings in args should be concatenated by. Defaults to a space (" ").
+
+        Returns:
+            str: The string that would be sent.
+        """
+
+        # check `check_type`, then converts each element
+        if check_type:
+            send_data = concatenate.join([self._check_output(i) for i in data])
+        else:
+            send_data = concatenate.join([str(i) for i in data])
+
+        # add ending to string
+        return send_data + ending
+
     def receive(self, num_before: int = 0) -> t.Optional[t.Tuple[float, bytes]]:
         """Returns the most recent receive object.
 
@@ -453,16 +555,78 @@ class BaseConnection(abc.ABC):
 
         return ret
 
+    def _set_low_latency(self, conn: serial.Serial) -> None:
+        """
+        Sets the `ASYNC_LOW_LATENCY` flag on the serial port through pyserial.
+
+        pyserial only implements this on Linux (using the `TIOCGSERIAL`/`TIOCSSERIAL` ioctls),
+        so this only warns on other platforms, or if the driver or permissions do not allow it.
+
+        On Windows, the FTDI driver's latency timer is a setting of the driver that is stored
+        in the registry and can only be changed persistently (and with administrator rights),
+        so it is not changed here. The read timeouts do not need to be changed either, because
+        the IO thread only reads the bytes that are already waiting.
+        """
+
+        try:
+            conn.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, OSError, ValueError) as e:
+            # Windows (no `set_low_latency_mode`), other posix platforms (not implemented),
+            # or driver does not support it
+            warnings.warn(
+                f"Could not set low latency mode on {self._port}: {e}", RuntimeWarning
+            )
+
     def _reset(self) -> None:
         """
         Resets all IO variables
         """
 
-        self._last_sent = time.time()  # prevents from sending too rapidly
+        self._last_sent = time.monotonic()  # prevents from sending too rapidly
 
         self._rcv_queue = []  # stores previous received strings
         self._to_send = []  # queue data to send
 
+        # wake up anything waiting for data
+        self._notify_rcv()
+
+    def _wake_io(self) -> None:
+        """
+        Wakes up the IO thread if it is resting
+        """
+
+        self._send_event.set()
+
+        wake_fds = self._wake_fds
+        if wake_fds is not None:
+            try:
+                os.write(wake_fds[1], b"\0")
+            except OSError:
+                # pipe is full, meaning that the IO thread will wake up anyway
+                pass
+
+    def _notify_rcv(self) -> None:
+        """
+        Wakes up threads waiting for received data
+        """
+
+        with self._rcv_cond:
+            self._rcv_count += 1
+            self._rcv_cond.notify_all()
+
+    def _wait_for_rcv(self, count: int, timeout: float) -> int:
+        """
+        Waits until the receive count is different from `count`
+        or until `timeout` seconds have passed, then returns the receive count.
+        """
+
+        with self._rcv_cond:
+            self._rcv_cond.wait_for(
+                lambda: self._rcv_count != count,
+                None if timeout == constants.NO_TIMEOUT else max(timeout, 0.0),
+            )
+            return self._rcv_count
+
     def _binary_search_rcv(self, target: float) -> int:
         """
         Binary searches a timestamp in the receive queue and returns the index of that timestamp.
@@ -5,8 +5,8 @@
 Contains implementation of connection object.
 """
 
-import copy
 import os
+import select
 import signal
 import time
 import typing as t
@@ -20,6 +20,9 @@ from .tools import ReceiveQueue, SendQueue
 if os.name == "posix":
     import termios
 
+# maximum number of bytes to combine into one write in the default IO thread (one USB packet)
+WRITE_CHUNK_SIZE = 64
+
 
 class Connection(BaseConnection):
     """Class that interfaces with the serial port.
@@ -28,6 +31,8 @@ class Connection(BaseConnection):
     If this does not happen, then the IO thread will still be running for an object that has already been deleted.
     """
 
+    __slots__ = ("_cyc_func",)
+
     def __enter__(self) -> "Connection":
         """
         Same as `BaseConnection.__enter__()` but returns `Connection` object rather than a `BaseConnection` object.
@@ -62,21 +67,22 @@ class Connection(BaseConnection):
         if rcv is None:
             return None
 
-        res = rcv.decode("utf-8")
+        data: t.Union[bytes, memoryview] = rcv
 
-        try:
-            ret = res[0 : res.index(str(read_until))]  # sliced string
-            if strip:
-                return ret.strip()
-            else:
-                return ret
+        if read_until is not None:
+            # look for read_until in the bytes so only the part before it is decoded;
+            # utf-8 never matches in the middle of a character so the index is the same
+            idx = rcv.find(str(read_until).encode("utf-8"))
+            if idx >= 0:
+                data = memoryview(rcv)[:idx]  # slice without copying
 
-        except (ValueError, TypeError):
-            # read_until does not exist or it is None, so return the entire thing
-            if strip:
-                return res.strip()
-            else:
-                return res
+        # if read_until is None or does not exist, then decode the entire thing
+        res = str(data, "utf-8")
+
+        if strip:
+            return res.strip()
+        else:
+            return res
 
     def get(
         self,
@@ -112,6 +118,9 @@ class Connection(BaseConnection):
 
         call_time = time.time()  # time that the function was called
 
+        # read before checking the receive queue so that no data is missed
+        rcv_count = self._rcv_count
+
         r: t.Optional[t.Tuple[float, t.Union[bytes, str]]] = None
         if return_bytes:
             r = self.receive()
@@ -126,11 +135,15 @@ class Connection(BaseConnection):
                 # timeout reached
                 return None
 
+            # sleep until the IO thread receives something new
+            rcv_count = self._wait_for_rcv(
+                rcv_count, self._timeout - (time.time() - st_t)
+            )
+
             if return_bytes:
                 r = self.receive()
             else:
                 r = self.receive_str(read_until=read_until, strip=strip)
-            time.sleep(0.01)
 
         # r received
         return r[1]
@@ -162,8 +175,10 @@ class Connection(BaseConnection):
         if not self.connected:
             raise ConnectException("No connection established")
 
+        # the tuples (timestamp, bytes) in the queue are immutable,
+        # so a shallow copy is enough to stop the IO thread from changing it
         with self._lock:
-            _rq = copy.deepcopy(self._rcv_queue)
+            _rq = self._rcv_queue.copy()
 
         # _rq is a copy of receive queue, meaning that it is in bytes
         if return_bytes:
@@ -324,6 +339,9 @@ class Connection(BaseConnection):
 
         call_time = time.time()  # for timeout
 
+        # read before checking the receive queue so that no data is missed
+        rcv_count = self._rcv_count
+
         r: t.Optional[t.Tuple[float, t.Union[bytes, str]]] = None
         if isinstance(response, bytes):
             r = self.receive()
@@ -338,13 +356,16 @@ class Connection(BaseConnection):
                 # timeout reached
                 return False
 
+            # sleep until the IO thread receives something new
+            rcv_count = self._wait_for_rcv(
+                rcv_count, self._timeout - (time.time() - call_time)
+            )
+
             if isinstance(response, bytes):
                 r = self.receive()
             else:
                 r = self.receive_str(read_until=read_until, strip=strip)
 
-            time.sleep(0.01)
-
         # correct response has been received
         return True
 
@@ -524,7 +545,8 @@ class Connection(BaseConnection):
 
         1. Checks if there is any data to be received
         2. If there is, reads all the data and puts the `bytes` received into the receive queue
-        3. Tries to send everything in the send queue; breaks when 0.5 seconds is reached (will continue if send queue is empty)
+        3. Tries to send everything in the send queue, combining objects into writes of up to 64 bytes; \
+        breaks when 0.5 seconds is reached (will continue if send queue is empty)
         """
 
         # flush buffers
@@ -532,31 +554,46 @@ class Connection(BaseConnection):
 
         # keep on trying to poll data as long as connection is still alive
         if conn.in_waiting:
-            # read everything from serial buffer
-            incoming = b""
+            # read everything from serial buffer; read all waiting bytes at once
+            # rather than one byte per call so there is one read per batch
+            incoming = bytearray()
             while conn.in_waiting:
-                incoming += conn.read()
-                time.sleep(0.001)
+                incoming += conn.read(conn.in_waiting)
+                time.sleep(0.001)  # wait for the rest of the data to arrive
 
             # add to queue
-            rcv_queue.pushitems(incoming)
+            rcv_queue.pushitems(bytes(incoming))
 
-        # sending data (send one at a time in queue for 0.5 seconds)
+        # sending data (send queue in chunks for 0.5 seconds)
         st_t = time.time()  # start time
         while time.time() - st_t < 0.5:
-            if len(send_queue) > 0:
-                conn.write(send_queue.front())  # write the front of the send queue
-                conn.flush()
-                send_queue.pop()  # pop the queue
-            else:
+            if len(send_queue) <= 0:
                 # break out if all sent
                 break
+
+            # combine the front of the send queue with the small objects after it
+            # so that they are written together rather than in one write each
+            chunk = bytearray(send_queue.front())
+            send_queue.pop()
+            while (
+                len(send_queue) > 0
+                and len(chunk) + len(send_queue.front()) <= WRITE_CHUNK_SIZE
+            ):
+                chunk += send_queue.front()
+                send_queue.pop()
+
+            conn.write(chunk)
+            conn.flush()
             time.sleep(0.01)
 
     def _cyc(self) -> None:
         """
         Each cycle of the IO thread
         """
+        # clear before copying the send queue so that anything sent
+        # after the copy wakes up the IO thread at the end of the cycle
+        self._send_event.clear()
+
         # make sure other threads cannot read/write variables
         # copy the variables to temporary ones so the locks don't block for so long
         with self._lock:
@@ -573,16 +610,64 @@ class Connection(BaseConnection):
 
         # make sure other threads cannot read/write variables
         with self._lock:
+            _new_rcv_queue = _rcv_queue.copy()
+
+            # new data was received if the most recent object changed
+            _received = len(_new_rcv_queue) > 0 and (
+                len(self._rcv_queue) == 0
+                or _new_rcv_queue[-1] is not self._rcv_queue[-1]
+            )
+
             # copy the variables back
-            self._rcv_queue = _rcv_queue.copy()
+            self._rcv_queue = _new_rcv_queue
 
             # delete the first element of send queue attribute for every object that was sent
             # as those elements were the ones that were sent and are not needed anymore
             for _ in range(_num_to_send_i - _num_to_send_f):
                 self._to_send.pop(0)
 
+        if _received:
+            # wake up methods waiting for data
+            self._notify_rcv()
+
         if self._rest_cpu:
-            time.sleep(0.01)  # rest CPU
+            self._rest()
+
+    def _rest(self) -> None:
+        """
+        Rests the IO thread between cycles to rest the CPU
+
+        With the default cycle on posix, waits for up to 0.05 seconds for data to come
+        from the serial port or for something to be sent. Otherwise, waits for up to
+        0.01 seconds for something to be sent.
+        """
+
+        conn = self._conn
+        wake_fds = self._wake_fds
+
+        if conn is None or wake_fds is None or self._cyc_func != self._default_cycle:
+            # custom cycles may leave data in the serial buffer, which would make
+            # waiting on the serial port return immediately every time
+            self._send_event.wait(0.01)
+            return
+
+        if self._send_event.is_set():
+            # something was sent during the cycle
+            return
+
+        try:
+            readable, _, _ = select.select([conn.fileno(), wake_fds[0]], [], [], 0.05)
+        except (OSError, ValueError, serial.SerialException):
+            # port was closed; the next cycle or the loop condition will handle it
+            return
+
+        if wake_fds[0] in readable:
+            # empty the pipe so the next rest does not wake up immediately
+            try:
+                while os.read(wake_fds[0], 512):
+                    pass
+            except OSError:
+                pass
 
     def _io_thread(self) -> None:
         """Thread that interacts with the serial port.
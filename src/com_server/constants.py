@@ -13,6 +13,10 @@ NO_SEND_INTERVAL = 0
 NORMAL_BAUD_RATE = 9600
 FAST_BAUD_RATE = 115200
 
+# sending
+DEFAULT_ENDING = "\r\n"
+DEFAULT_CONCATENATE = " "
+
 # receive queue
 NO_RCV_QUEUE = 1  # not 0 because the program would then disregard all incoming data
 RCV_QUEUE_SIZE_XSMALL = 32
@@ -7,7 +7,6 @@ Contains disconnect handling for the `RestApiHandler`
 
 import logging
 import threading
-import time
 import typing as t
 
 from .connection import Connection
@@ -18,6 +17,16 @@ class BaseReconnector(threading.Thread):
 
     _logger: logging.Logger
     _logf: t.Optional[str]
+    _stop_event: threading.Event
+
+    def stop(self) -> None:
+        """Stops checking the connections.
+
+        The thread exits within 0.01 seconds, unless it is
+        in the middle of reconnecting, which is not interrupted.
+        """
+
+        self._stop_event.set()
 
     def _init_logger(self) -> None:
         """Initializes logger to stdout"""
@@ -82,14 +91,15 @@ class Reconnector(BaseReconnector):
 
         # threading
         super().__init__(daemon=True)
+        self._stop_event = threading.Event()
 
     def run(self) -> None:
         """What to run in thread
 
-        In this case, checks if the serial port every 0.01 seconds.
+        In this case, checks if the serial port every 0.01 seconds until `stop()` is called.
         """
 
-        while True:
+        while not self._stop_event.is_set():
             if not self._conn.connected:
                 self._logger.warning("Device disconnected")
                 self._logger.info("Attempting to reconnect...")
@@ -98,7 +108,7 @@ class Reconnector(BaseReconnector):
 
                 self._logger.info(f"Device reconnected at {self._conn.port}")
 
-            time.sleep(0.01)
+            self._stop_event.wait(0.01)
 
 
 class MultiReconnector(BaseReconnector):
@@ -138,11 +148,12 @@ class MultiReconnector(BaseReconnector):
 
         # threading
         super().__init__(daemon=True)
+        self._stop_event = threading.Event()
 
     def run(self) -> None:
         """What to run in thread
 
-        In this case, checks if the serial port every 0.01 seconds.
+        In this case, checks if the serial ports every 0.01 seconds until `stop()` is called.
         """
 
         cur_reconn = set()
@@ -168,7 +179,7 @@ class MultiReconnector(BaseReconnector):
             # remove of set of currently reconnecting objects after reconnected
             cur_reconn.remove(conn)
 
-        while True:
+        while not self._stop_event.is_set():
             for conn in self._conns:
                 if conn in cur_reconn:
                     continue
@@ -177,4 +188,4 @@ class MultiReconnector(BaseReconnector):
                     # start thread to reconnect
                     threading.Thread(target=_reconn, args=(conn,), daemon=True).start()
 
-            time.sleep(0.01)
+            self._stop_event.wait(0.01)
@@ -6,11 +6,19 @@ Provides a set of functions that could be generally useful.
 """
 
 import copy
+import threading
 import time
 import typing as t
 
 from serial.tools.list_ports import comports
 
+# number of seconds that `cached_ports()` reuses the list of ports for
+PORTS_CACHE_TTL = 1.0
+
+# (time.monotonic() when listed, ports)
+_ports_cache: t.Tuple[float, t.Tuple[t.Tuple[str, str, str], ...]] = (float("-inf"), ())
+_ports_lock = threading.Lock()  # so only one thread lists the ports at a time
+
 
 def all_ports(**kwargs: t.Any) -> t.Any:
     """Gets all ports from serial interface.
@@ -22,6 +30,37 @@ def all_ports(**kwargs: t.Any) -> t.Any:
     return comports(**kwargs)
 
 
+def cached_ports(ttl: float = PORTS_CACHE_TTL) -> t.Tuple[t.Tuple[str, str, str], ...]:
+    """Gets all ports as `(port, description, hardware id)` tuples, listing them at most once every `ttl` seconds.
+
+    Listing the ports goes through the operating system every time, but the
+    ports change rarely, so this is used by the builtin endpoints that list ports.
+
+    Args:
+        ttl (float, optional): The number of seconds to reuse the list of ports for. Defaults to `PORTS_CACHE_TTL`.
+
+    Returns:
+        Tuple[Tuple[str, str, str], ...]: The ports; `(port, description, hardware id)` for each port.
+    """
+
+    global _ports_cache
+
+    listed_at, ports = _ports_cache
+    if time.monotonic() - listed_at < ttl:
+        return ports
+
+    with _ports_lock:
+        # another thread may have listed the ports while this one was waiting
+        listed_at, ports = _ports_cache
+        if time.monotonic() - listed_at < ttl:
+            return ports
+
+        ports = tuple((port, desc, hwid) for port, desc, hwid in all_ports())
+        _ports_cache = (time.monotonic(), ports)
+
+    return ports
+
+
 class SendQueue:
     """The send queue object
 
@@ -145,8 +184,8 @@ class ReceiveQueue:
     def pushitems(self, *args: bytes) -> None:
         """Adds a list of items to the receive queue
 
-        If the size exceeds `queue_size` when adding, then
-        it will pop the front of the queue.
+        If the size exceeds `queue_size` after adding, then
+        it will remove objects from the front of the queue.
 
         A tuple (timestamp, bytes) will be added. The timestamp
         will be regenerated for each iteration of the for loop
@@ -159,16 +198,19 @@ class ReceiveQueue:
             TypeError: If one of the items in *args is not a bytes object
         """
 
-        for obj in args:
-            if not isinstance(obj, bytes):
-                raise TypeError("Every argument must be a bytes object")
-
-            # add timestamp, obj to queue
-            self._rcv_queue.append((time.time(), obj))
+        try:
+            for obj in args:
+                if not isinstance(obj, bytes):
+                    raise TypeError("Every argument must be a bytes object")
 
-            if len(self._rcv_queue) > self._queue_size:
-                # if greater than queue size, then pop first element
-                self._rcv_queue.pop(0)
+                # add timestamp, obj to queue
+                self._rcv_queue.append((time.time(), obj))
+        finally:
+            # if greater than queue size, then remove the extra elements from the front
+            # all at once rather than shifting the list once for every object added
+            excess = len(self._rcv_queue) - self._queue_size
+            if excess > 0:
+                del self._rcv_queue[:excess]
 
     def copy(self) -> t.List[t.Tuple[float, bytes]]:
         """Returns a shallow copy of the receive queue list
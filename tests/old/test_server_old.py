@@ -66,9 +66,6 @@ def test_duplicate_class_no_exception() -> None:
         def get(self):
             return {"hello": "world2"}
 
-    for e, r in handler._all_endpoints:
-        handler._api.add_resource(r, e)
-
     assert len(handler._all_endpoints) == 2
 
 
@@ -90,9 +87,6 @@ def test_duplicate_func_name_no_exception() -> None:
         def get(self):
             return {"hello": "world2"}
 
-    for e, r in handler._all_endpoints:
-        handler._api.add_resource(r, e)
-
     assert len(handler._all_endpoints) == 2
 
 
@@ -9,6 +9,7 @@ import glob
 import sys
 import re
 
+from com_server import tools
 from com_server.tools import all_ports
 
 import pytest
@@ -42,3 +43,25 @@ def test_ports():
     ports = [a for a, _, _ in all_ports() if re.match(MATCH, a)]
 
     assert len(ports) > 0
+
+
+def test_cached_ports(monkeypatch) -> None:
+    """
+    Tests that `cached_ports` only lists the ports again after the TTL.
+    """
+
+    calls = []
+
+    def _all_ports():
+        calls.append(1)
+        return [("port", "desc", "hwid")]
+
+    monkeypatch.setattr(tools, "all_ports", _all_ports)
+    monkeypatch.setattr(tools, "_ports_cache", (float("-inf"), ()))
+
+    assert tools.cached_ports(ttl=60) == (("port", "desc", "hwid"),)
+    assert tools.cached_ports(ttl=60) == (("port", "desc", "hwid"),)
+    assert len(calls) == 1
+
+    tools.cached_ports(ttl=0)
+    assert len(calls) == 2
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for `RestApiHandler` that do not need a serial connection.
+"""
+
+import threading
+import time
+import typing as t
+
+import flask_restful
+import pytest
+from com_server import (
+    Connection,
+    ConnectionResource,
+    EndpointExistsException,
+    RestApiHandler,
+)
+from com_server.api_server import _SharedLock
+
+
+def test_add_endpoint_factory_called_once() -> None:
+    """
+    A function under `add_endpoint` should be called once and its class registered
+    """
+
+    conn = Connection(115200, "/dev/ttyUSB0")
+    handler = RestApiHandler(conn)
+
+    calls = []
+
+    @handler.add_endpoint("/factory")
+    def _factory():
+        calls.append(1)
+
+        class Factory(ConnectionResource):
+            def get(self):
+                return {"message": "OK"}
+
+        return Factory
+
+    assert len(calls) == 1
+    assert len(handler._all_endpoints) == 1
+    assert issubclass(handler._all_endpoints["/factory"], ConnectionResource)
+
+    # added to the Flask app right away, not when the server is run
+    assert "/factory" in {rule.rule for rule in handler.flask_obj.url_map.iter_rules()}
+
+
+def test_builtins_on_two_handlers() -> None:
+    """
+    Builtins added to two handlers should each use their own connection
+    """
+
+    from com_server.api import V0
+
+    conn1 = Connection(115200, "/dev/ttyUSB0")
+    conn2 = Connection(115200, "/dev/ttyUSB1")
+    handler1 = RestApiHandler(conn1)
+    handler2 = RestApiHandler(conn2)
+
+    V0(handler1)
+    V0(handler2, verbose=True)
+
+    res1 = handler1._all_endpoints
+    res2 = handler2._all_endpoints
+
+    assert res1.keys() == res2.keys()
+    for endpoint in res1:
+        assert res1[endpoint].conn is conn1
+        assert res2[endpoint].conn is conn2
+        assert not res1[endpoint].verbose
+        assert res2[endpoint].verbose
+
+
+def _rw_handler(**kwargs) -> RestApiHandler:
+    """Makes a handler with a GET and POST endpoint"""
+
+    conn = Connection(115200, "/dev/ttyUSB0")
+    handler = RestApiHandler(conn, **kwargs)
+
+    @handler.add_endpoint("/rw")
+    class ReadWrite(ConnectionResource):
+        def get(self):
+            return {"message": "OK"}
+
+        def post(self):
+            return {"message": "OK"}
+
+    return handler
+
+
+def test_shared_lock() -> None:
+    """
+    Shared holders should exclude only exclusive holders
+    """
+
+    lock = _SharedLock()
+
+    assert lock.acquire(shared=True)
+    assert lock.acquire(shared=True)
+    assert not lock.acquire()
+
+    lock.release(shared=True)
+    lock.release(shared=True)
+    assert lock.acquire()
+    assert not lock.acquire(shared=True)
+    assert not lock.acquire()
+
+    lock.release()
+    assert lock.acquire(shared=True)
+
+
+def test_shared_reads() -> None:
+    """
+    GET requests should only run together if `shared_reads` is True
+    """
+
+    handler = _rw_handler(has_register_recall=False, shared_reads=True)
+    client = handler.flask_obj.test_client()
+
+    # as if a GET request is being handled
+    handler._lock.acquire(shared=True)
+    assert client.get("/rw").status_code == 200
+    assert client.post("/rw").status_code == 503
+    handler._lock.release(shared=True)
+
+    assert client.post("/rw").status_code == 200
+
+    handler = _rw_handler(has_register_recall=False, shared_reads=False)
+    client = handler.flask_obj.test_client()
+
+    handler._lock.acquire()
+    assert client.get("/rw").status_code == 503
+    handler._lock.release()
+
+    assert client.get("/rw").status_code == 200
+
+
+def test_register_recall() -> None:
+    """
+    Endpoints should only be usable by the registered IP
+    """
+
+    handler = _rw_handler()
+    client = handler.flask_obj.test_client()
+
+    assert client.get("/rw").status_code == 400
+    assert client.get("/register").status_code == 200
+    assert client.get("/rw").status_code == 200
+    assert client.get("/rw", environ_base={"REMOTE_ADDR": "10.0.0.2"}).status_code == 400
+    assert client.get("/recall").status_code == 200
+    assert client.get("/rw").status_code == 400
+
+
+class _SlowRegistered(RestApiHandler):
+    """
+    Handler that waits after reading the registered IP, so that requests
+    made at the same time all check it before any of them can set it
+    """
+
+    @property
+    def _registered(self) -> t.Optional[str]:
+        registered = self._registered_ip
+        time.sleep(0.05)
+        return registered
+
+    @_registered.setter
+    def _registered(self, value: t.Optional[str]) -> None:
+        self._registered_ip = value
+
+
+def test_concurrent_register() -> None:
+    """
+    Only one of two IPs registering at the same time should be registered
+    """
+
+    handler = _SlowRegistered(Connection(115200, "/dev/ttyUSB0"))
+    ips = ["10.0.0.1", "10.0.0.2"]
+    barrier = threading.Barrier(len(ips))
+    statuses = []
+
+    def _register(ip: str) -> None:
+        client = handler.flask_obj.test_client()
+        barrier.wait()
+        res = client.get("/register", environ_base={"REMOTE_ADDR": ip})
+        statuses.append(res.status_code)
+
+    threads = [threading.Thread(target=_register, args=(ip,)) for ip in ips]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(statuses) == [200, 400]
+
+
+def test_not_found_cache_control() -> None:
+    """
+    Only 404s for URLs without an endpoint should be cacheable
+    """
+
+    handler = _rw_handler(has_register_recall=False)
+
+    @handler.add_endpoint("/missing")
+    class Missing(ConnectionResource):
+        def get(self):
+            flask_restful.abort(404, message="Nothing received")
+
+    client = handler.flask_obj.test_client()
+
+    res = client.get("/unknown")
+    assert res.status_code == 404
+    assert res.headers["Cache-Control"] == "public, max-age=1"
+
+    res = client.get("/missing")
+    assert res.status_code == 404
+    assert "Cache-Control" not in res.headers
+
+
+def test_duplicate_endpoints_and_names() -> None:
+    """
+    Duplicate endpoints should raise and duplicate class names should be renamed
+    """
+
+    handler = RestApiHandler(Connection(115200, "/dev/ttyUSB0"))
+
+    def _make():
+        class Same(ConnectionResource):
+            def get(self):
+                return {"message": "OK"}
+
+        return Same
+
+    first = handler.add_endpoint("/a")(_make())
+    second = handler.add_endpoint("/b")(_make())
+    third = handler.add_endpoint("/c")(_make())
+
+    names = (first.__name__, second.__name__, third.__name__)
+    assert names == ("Same", "Same_", "Same__")
+
+    with pytest.raises(EndpointExistsException):
+        handler.add_endpoint("/a")(_make())
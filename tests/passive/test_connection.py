@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for `Connection` that do not need a serial port
+"""
+
+import weakref
+
+from com_server import Connection
+
+
+def test_weakref() -> None:
+    """Tests that a `Connection` can be weakly referenced even though it uses `__slots__`"""
+
+    conn = Connection(115200, "/dev/ttyUSB0")
+    ref = weakref.ref(conn)
+
+    assert ref() is conn
+    assert not hasattr(conn, "__dict__")
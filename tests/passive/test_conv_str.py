@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests converting received bytes to strings in Connection
+"""
+
+from com_server import Connection
+
+
+def test_conv_read_until() -> None:
+    """Tests that the string is cut off at the first `read_until`"""
+
+    conn = Connection(port="test", baud=123)
+
+    assert conn.conv_bytes_to_str(b" abc]def]", read_until="]") == "abc"
+    assert conn.conv_bytes_to_str(b" abc]def]", read_until="]", strip=False) == " abc"
+    assert conn.conv_bytes_to_str("é]x".encode("utf-8"), read_until="]") == "é"
+
+
+def test_conv_no_read_until() -> None:
+    """Tests that the entire string is returned if `read_until` is None or not found"""
+
+    conn = Connection(port="test", baud=123)
+
+    assert conn.conv_bytes_to_str(b"abc None\r\n") == "abc None"
+    assert conn.conv_bytes_to_str(b"abc\r\n", read_until="]") == "abc"
+    assert conn.conv_bytes_to_str(None) is None
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests the disconnect handlers
+"""
+
+import logging
+
+from com_server.disconnect import MultiReconnector, Reconnector
+
+
+class _Connected:
+    """Stands in for a `Connection` that stays connected"""
+
+    connected = True
+    port = "/dev/ttyUSB0"
+
+
+def test_reconnector_stop() -> None:
+    """Tests that the disconnect handlers exit after `stop()`"""
+
+    logger = logging.getLogger("test_disconnect")
+
+    for handler in (
+        Reconnector(_Connected(), logger),
+        MultiReconnector(logger, _Connected(), _Connected()),
+    ):
+        handler.start()
+        assert handler.is_alive()
+
+        handler.stop()
+        handler.join(timeout=1)
+        assert not handler.is_alive()
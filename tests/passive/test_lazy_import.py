@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests that the server modules are only imported when they are used
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="module __getattr__ requires Python 3.7"
+)
+def test_connection_does_not_import_flask() -> None:
+    """Tests that importing com_server does not import Flask until a server class is used"""
+
+    code = (
+        "import sys, com_server\n"
+        "assert 'flask' not in sys.modules\n"
+        "com_server.ConnectionRoutes\n"
+        "assert 'flask' in sys.modules\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests setting low latency mode on serial ports that do not support it
+"""
+
+import pytest
+from com_server import Connection
+
+
+def _set_low_latency(port: object) -> None:
+    """Sets low latency mode on `port`, which should warn and not raise"""
+
+    conn = Connection(115200, "/dev/ttyUSB0", low_latency=True)
+
+    with pytest.warns(RuntimeWarning, match="Could not set low latency mode"):
+        conn._set_low_latency(port)
+
+
+def test_low_latency_no_method_warns() -> None:
+    """Tests that low latency mode warns if the port has no `set_low_latency_mode`, like on Windows"""
+
+    _set_low_latency(object())
+
+
+def test_low_latency_not_implemented_warns() -> None:
+    """Tests that low latency mode warns if pyserial does not implement it, like on macOS and BSD"""
+
+    serialposix = pytest.importorskip("serial.serialposix")
+
+    _set_low_latency(serialposix.PlatformSpecificBase())
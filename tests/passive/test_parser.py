@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests the request parser used by the builtin endpoints
+"""
+
+import pytest
+from com_server.api.parser import RequestParser, boolean
+from flask import Flask
+from flask_restful import reqparse
+from werkzeug.exceptions import HTTPException
+
+app = Flask(__name__)
+
+
+def _add_args(parser) -> None:
+    parser.add_argument("data", required=True, action="append", help="data help")
+    parser.add_argument("ending", default="\r\n")
+    parser.add_argument("num_before", type=int, default=0)
+
+
+def _parse_both(**kwargs) -> tuple:
+    """Parses the same request with reqparse and `RequestParser`"""
+
+    parser = RequestParser()
+    old_parser = reqparse.RequestParser()
+    _add_args(parser)
+    _add_args(old_parser)
+
+    with app.test_request_context(method="POST", **kwargs):
+        return parser.parse_args(strict=True), dict(old_parser.parse_args(strict=True))
+
+
+def test_parse_json_same_as_reqparse() -> None:
+    """Tests that arguments in a JSON body are parsed like reqparse"""
+
+    new, old = _parse_both(json={"data": ["a", 1], "num_before": "3"})
+
+    assert new == old == {"data": ["a", "1"], "ending": "\r\n", "num_before": 3}
+
+
+def test_parse_json_and_query_string() -> None:
+    """Tests that a JSON body is combined with the query string, JSON values first"""
+
+    new, old = _parse_both(
+        json={"data": ["a"]}, query_string={"data": "b", "num_before": "2"}
+    )
+
+    assert new == old == {"data": ["a", "b"], "ending": "\r\n", "num_before": 2}
+
+
+def test_parse_form() -> None:
+    """Tests that arguments in a form and query string are parsed"""
+
+    # not compared with reqparse, which responds with 415 to non-JSON bodies on newer Werkzeug
+    parser = RequestParser()
+    _add_args(parser)
+
+    with app.test_request_context(
+        method="POST",
+        data={"data": ["a", "b"], "ending": "\n"},
+        query_string={"num_before": "1"},
+    ):
+        args = parser.parse_args(strict=True)
+
+    assert args == {"data": ["a", "b"], "ending": "\n", "num_before": 1}
+
+
+def test_parse_missing_and_unknown() -> None:
+    """Tests that missing required arguments and unknown arguments respond with 400"""
+
+    parser = RequestParser()
+    _add_args(parser)
+
+    with app.test_request_context(method="POST", json={"ending": "\n"}):
+        with pytest.raises(HTTPException) as e:
+            parser.parse_args(strict=True)
+        assert e.value.code == 400
+        assert e.value.data == {"message": {"data": "data help"}}
+
+    with app.test_request_context(method="POST", json={"data": "a", "other": 1}):
+        with pytest.raises(HTTPException) as e:
+            parser.parse_args(strict=True)
+        assert e.value.code == 400
+
+        # not strict, so other is ignored
+        assert parser.parse_args()["data"] == ["a"]
+
+
+def test_parse_empty_request() -> None:
+    """Tests that a request without arguments gets the defaults"""
+
+    parser = RequestParser()
+    parser.add_argument("num_before", type=int, default=0)
+    parser.add_argument("read_until", default=None)
+
+    with app.test_request_context(method="POST"):
+        args = parser.parse_args(strict=True)
+        assert args == {"num_before": 0, "read_until": None}
+
+        # changing the result does not change the defaults
+        args["num_before"] = 1
+        assert parser.parse_args(strict=True)["num_before"] == 0
+
+    # required arguments are still checked
+    parser.add_argument("data", required=True)
+
+    with app.test_request_context(method="POST"):
+        with pytest.raises(HTTPException):
+            parser.parse_args(strict=True)
+
+
+def test_parse_boolean() -> None:
+    """Tests that boolean arguments parse "false" as False"""
+
+    assert boolean(True) is True
+    assert boolean(False) is False
+    assert boolean("False") is False
+    assert boolean("0") is False
+    assert boolean("true") is True
+    assert boolean("ON") is True
+
+    parser = RequestParser()
+    parser.add_argument("strip", type=boolean, default=False)
+
+    with app.test_request_context(method="POST", query_string={"strip": "false"}):
+        assert parser.parse_args(strict=True) == {"strip": False}
+
+    with app.test_request_context(method="POST", json={"strip": "maybe"}):
+        with pytest.raises(HTTPException) as e:
+            parser.parse_args(strict=True)
+        assert e.value.code == 400
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests the responses shared by the builtin endpoints
+"""
+
+from com_server.api.responses import conditional, nothing_received, ok
+from flask import Flask
+from flask_restful.representations.json import output_json
+
+app = Flask(__name__)
+
+
+@app.route("/state")
+def _state():
+    return conditional({"message": "OK"}, max_age=1)
+
+
+def _conditional(data: dict, **kwargs):
+    with app.test_request_context(**kwargs):
+        return conditional(data, max_age=1)
+
+
+def test_conditional_etag() -> None:
+    """Tests that the response has an ETag that changes with the data"""
+
+    res = _conditional({"message": "OK", "connected": True})
+
+    assert res.status_code == 200
+    assert res.get_json() == {"message": "OK", "connected": True}
+    assert res.headers["Cache-Control"] == "max-age=1"
+
+    etag, _ = res.get_etag()
+    assert etag
+    assert _conditional({"message": "OK", "connected": False}).get_etag()[0] != etag
+
+
+def test_conditional_not_modified() -> None:
+    """Tests that a matching If-None-Match responds with 304"""
+
+    client = app.test_client()
+    etag = client.get("/state").headers["ETag"]
+
+    res = client.get("/state", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert not res.get_data()
+
+    res = client.get("/state", headers={"If-None-Match": '"other"'})
+    assert res.status_code == 200
+    assert res.get_json() == {"message": "OK"}
+
+
+def test_preencoded_same_as_encoded() -> None:
+    """Tests that pre-encoded responses have the same body `RestApiHandler` would encode"""
+
+    app.config["RESTFUL_JSON"] = {"separators": (",", ":")}
+
+    with app.test_request_context():
+        res = ok()
+        assert res is not ok()
+        assert res.mimetype == "application/json"
+        assert res.get_data() == output_json({"message": "OK"}, 200).get_data()
+
+        res = nothing_received()
+        data = {"message": "OK", "timestamp": None, "data": None}
+        assert res.get_data() == output_json(data, 200).get_data()
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from com_server import Connection, ConnectionRoutes, RestApiHandler
-from com_server.api import V1
+import typing as t
+
 import pytest
+import serial
+from com_server import Connection, ConnectionRoutes, RestApiHandler, add_resources
+from com_server.api import V1
+from flask import Flask
+from flask_restful import Api
 
 
 def test_all_routes_being_added() -> None:
@@ -19,6 +24,7 @@ def test_all_routes_being_added() -> None:
 
     _endpoints = [
         "/send",
+        "/send/batch",
         "/receive/<int:num_before>",
         "/receive",
         "/get",
@@ -40,3 +46,41 @@ def test_not_connection_routes_raises_exception() -> None:
 
     with pytest.raises(TypeError):
         V1(handler)
+
+
+def _sent(
+    conn: Connection, client: t.Any, endpoint: str, body: dict
+) -> t.Tuple[int, list]:
+    """Posts `body` to `endpoint`, then returns the status and the bytes queued"""
+
+    conn._to_send = []
+
+    res = client.post(endpoint, json=body)
+    return res.status_code, conn._to_send
+
+
+def test_send_batch_same_as_send() -> None:
+    """Tests that /send/batch sends each item the same way /send does"""
+
+    conn = Connection(115200, "/dev/ttyUSB0", send_interval=0)
+    conn._conn = serial.serial_for_url("loop://")  # connected without the IO thread
+    handler = ConnectionRoutes(conn)
+    V1(handler)
+
+    app = Flask(__name__)
+    add_resources(Api(app), handler)
+    client = app.test_client()
+
+    item = {"data": [" a ", {"x": 1}], "ending": "\r\n"}
+    assert _sent(conn, client, "/v1/send", item) == (200, [b"a {'x': 1}\r\n"])
+    assert _sent(conn, client, "/v1/send/batch", {"items": [item]}) == (
+        200,
+        [b"a {'x': 1}\r\n"],
+    )
+
+    body = {"items": [{"data": ["a", "b"]}, {"data": 1, "ending": "\n"}]}
+    assert _sent(conn, client, "/v1/send/batch", body) == (200, [b"a b\r\n1\n"])
+
+    # empty data is rejected like it is by /send
+    assert _sent(conn, client, "/v1/send", {"data": []})[0] == 400
+    assert _sent(conn, client, "/v1/send/batch", {"items": [{"data": []}]}) == (400, [])